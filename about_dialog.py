@@ -1,13 +1,12 @@
 """About dialog for Crypto Ticker."""
 
+import functools
 import sys
 from pathlib import Path
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QWidget
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QDesktopServices, QPixmap, QIcon
+from PySide6.QtGui import QFont, QDesktopServices, QPixmap, QIcon, QPixmapCache
 from PySide6.QtCore import QUrl
-from PySide6.QtSvg import QSvgRenderer
-from PySide6.QtGui import QPainter, QImage
 
 from version import __version__, __app_name__, __author__, __github__, __license__
 
@@ -21,7 +20,9 @@ class AboutDialog(QDialog):
         self.setFixedSize(350, 300)
         self._setup_ui()
 
-    def _get_icon_path(self) -> Path:
+    @staticmethod
+    @functools.cache
+    def _get_icon_path() -> Path:
         """Get the path to the logo file."""
         if getattr(sys, 'frozen', False):
             app_dir = Path(sys.executable).parent
@@ -40,14 +41,25 @@ class AboutDialog(QDialog):
             icon_label = QLabel()
             icon_label.setAlignment(Qt.AlignCenter)
             icon_label.setFixedSize(80, 80)
-            # Render SVG to pixmap
-            renderer = QSvgRenderer(str(icon_path))
-            image = QImage(80, 80, QImage.Format_ARGB32)
-            image.fill(0)
-            painter = QPainter(image)
-            renderer.render(painter)
-            painter.end()
-            pixmap = QPixmap.fromImage(image)
+            # Render SVG to pixmap once per device pixel ratio
+            dpr = self.devicePixelRatioF()
+            key = f"about_logo_{dpr}"
+            pixmap = QPixmapCache.find(key)
+            if pixmap is None or pixmap.isNull():
+                # Imported lazily so app startup doesn't load the Qt SVG module
+                from PySide6.QtSvg import QSvgRenderer
+                from PySide6.QtGui import QPainter, QImage
+
+                size = int(80 * dpr)
+                renderer = QSvgRenderer(str(icon_path))
+                image = QImage(size, size, QImage.Format_ARGB32)
+                image.fill(0)
+                painter = QPainter(image)
+                renderer.render(painter)
+                painter.end()
+                pixmap = QPixmap.fromImage(image)
+                pixmap.setDevicePixelRatio(dpr)
+                QPixmapCache.insert(key, pixmap)
             icon_label.setPixmap(pixmap)
             layout.addWidget(icon_label, alignment=Qt.AlignCenter)
 
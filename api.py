@@ -1,13 +1,44 @@
 """CoinGecko API integration with caching and retry logic."""
 
 import json
+import os
+import pickle
+import threading
 import time
-import requests
+import httpx
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Callable
+from typing import Optional, Dict, List, Callable, Tuple
 from dataclasses import dataclass
-from tenacity import retry, stop_after_attempt, wait_fixed, retry_if_exception_type
+from tenacity import Retrying, stop_after_attempt, wait_fixed, retry_if_exception_type
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to stdlib json
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional: coin list is parsed in full instead
+    ijson = None
+
+
+def _dumps(data) -> bytes:
+    """Serialize data to JSON bytes."""
+    if orjson:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes):
+    """Deserialize JSON bytes."""
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Returned by _make_request when the server answers 304 Not Modified
+NOT_MODIFIED = object()
 
 
 class RateLimitError(Exception):
@@ -15,7 +46,7 @@ class RateLimitError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class APIState:
     """Tracks API state for pause/resume functionality."""
     paused: bool = False
@@ -23,13 +54,12 @@ class APIState:
     auto_pause_until: Optional[float] = None
     last_error: Optional[str] = None
 
-    def should_skip(self) -> bool:
+    def should_skip(self, _now=time.monotonic) -> bool:
         """Check if API calls should be skipped."""
-        if self.paused:
-            return True
-        if self.auto_pause_until and time.time() < self.auto_pause_until:
-            return True
-        return False
+        # _now is bound at definition time to skip the global lookup on this hot path
+        return self.paused or (
+            self.auto_pause_until is not None and _now() < self.auto_pause_until
+        )
 
     def record_failure(self, error: str):
         """Record a failure and check for auto-pause."""
@@ -37,7 +67,7 @@ class APIState:
         self.last_error = error
         if self.consecutive_failures >= 10:
             # Auto-pause for 30 minutes
-            self.auto_pause_until = time.time() + (30 * 60)
+            self.auto_pause_until = time.monotonic() + (30 * 60)
 
     def record_success(self):
         """Record a successful call."""
@@ -53,7 +83,7 @@ class APIState:
     def get_auto_resume_remaining(self) -> Optional[int]:
         """Get seconds until auto-resume, or None if not auto-paused."""
         if self.auto_pause_until:
-            remaining = self.auto_pause_until - time.time()
+            remaining = self.auto_pause_until - time.monotonic()
             return max(0, int(remaining))
         return None
 
@@ -63,18 +93,39 @@ class CoinGeckoAPI:
 
     BASE_URL = "https://api.coingecko.com/api/v3"
     CACHE_DURATION = timedelta(hours=24)
+    PRICE_CACHE_SECONDS = 30  # Prices younger than this are reused without a request
 
     def __init__(self, cache_dir: Path):
         self.cache_dir = cache_dir
-        self.session = requests.Session()
-        self.session.headers.update({"Accept": "application/json"})
+        # Single HTTP/2 connection reused for the process lifetime
+        self.session = httpx.Client(
+            http2=True,
+            headers={"Accept": "application/json"},
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300),
+        )
         self.state = APIState()
 
         # Retry configuration (will be updated from settings)
         self.retry_attempts = 3
         self.retry_wait = 5
+        self._retrying = self._build_retrying()
+
+        # Parsed cache files kept in memory: name -> (monotonic expiry, data)
+        self._mem_cache: Dict[str, Tuple[float, object]] = {}
 
-        # Callbacks for state changes
+        # Last fetched prices: (symbol, vs_currency) -> (monotonic fetch time, price)
+        self._price_cache: Dict[Tuple[str, str], Tuple[float, float]] = {}
+
+        # symbol -> id index derived from the coin list (rebuilt on refresh)
+        self._symbol_to_id: Optional[Dict[str, str]] = None
+        self._symbol_to_id_expiry = 0.0
+
+        # Serializes requests and cache/index updates: prices are fetched on the
+        # price worker thread while the settings dialog loads lists from the pool
+        self._lock = threading.RLock()
+
+        # Callbacks for state changes (called on whichever thread made the request)
         self.on_state_change: Optional[Callable[[APIState], None]] = None
 
     def _get_cache_path(self, name: str) -> Path:
@@ -89,58 +140,272 @@ class CoinGeckoAPI:
         return datetime.now() - mtime < self.CACHE_DURATION
 
     def _load_cache(self, name: str) -> Optional[dict]:
-        """Load data from cache if valid."""
+        """Load data from cache if valid (memory first, then disk)."""
+        entry = self._mem_cache.get(name)
+        if entry and time.monotonic() < entry[0]:
+            return entry[1]
+
         cache_path = self._get_cache_path(name)
-        if self._is_cache_valid(cache_path):
+        try:
+            age = time.time() - cache_path.stat().st_mtime
+            remaining = self.CACHE_DURATION.total_seconds() - age
+            if remaining <= 0:
+                return None
+            data = _loads(cache_path.read_bytes())
+        except (ValueError, IOError):
+            return None
+        self._mem_cache[name] = (time.monotonic() + remaining, data)
+        return data
+
+    def _get_meta_path(self, name: str) -> Path:
+        """Get path for a cache file's HTTP validator sidecar."""
+        return self.cache_dir / f"{name}.meta.json"
+
+    def _load_cache_meta(self, name: str) -> dict:
+        """Load stored ETag/Last-Modified for a cache file (ignores expiry)."""
+        try:
+            meta = _loads(self._get_meta_path(name).read_bytes())
+            return meta if isinstance(meta, dict) else {}
+        except (ValueError, IOError):
+            return {}
+
+    def _save_cache_meta(self, name: str, validators: Optional[dict]):
+        """Save HTTP validators for a cache file, or drop stale ones."""
+        meta_path = self._get_meta_path(name)
+        try:
+            if validators:
+                meta_path.write_bytes(_dumps(validators))
+            elif meta_path.exists():
+                meta_path.unlink()
+        except (TypeError, IOError):
+            pass
+
+    def _save_cache(self, name: str, data: dict, validators: Optional[dict] = None):
+        """Save data to cache, plus HTTP validators if the server sent any."""
+        cache_path = self._get_cache_path(name)
+        self._mem_cache[name] = (
+            time.monotonic() + self.CACHE_DURATION.total_seconds(), data
+        )
+        try:
+            cache_path.write_bytes(_dumps(data))
+        except (TypeError, IOError):
+            return
+        self._save_cache_meta(name, validators)
+
+    def _get_conditional_headers(self, name: str) -> Optional[dict]:
+        """Build If-None-Match/If-Modified-Since headers for an expired cache file."""
+        if not self._get_cache_path(name).exists():
+            return None
+        meta = self._load_cache_meta(name)
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers or None
+
+    def _drop_cache(self, name: str):
+        """Delete a cache file and its validators."""
+        self._mem_cache.pop(name, None)
+        for path in (self._get_cache_path(name), self._get_meta_path(name)):
             try:
-                with open(cache_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                path.unlink(missing_ok=True)
+            except OSError:
                 pass
-        return None
 
-    def _save_cache(self, name: str, data: dict):
-        """Save data to cache."""
+    def _touch_cache(self, name: str) -> bool:
+        """Mark a cache file as fresh again (after a 304 response)."""
+        try:
+            os.utime(self._get_cache_path(name), None)
+            return True
+        except OSError:
+            return False
+
+    def _fetch_cached(self, name: str, url: str):
+        """
+        Get a 24h-cached resource.
+
+        An expired cache is revalidated with If-None-Match/If-Modified-Since;
+        on 304 the cache file is touched and reused without a download.
+        """
+        cached = self._load_cache(name)
+        if cached:
+            return cached
+
+        validators = {}
+        data = self._make_request(
+            url,
+            conditional_headers=self._get_conditional_headers(name),
+            validators=validators,
+            check_body=True
+        )
+        if data is NOT_MODIFIED:
+            cached = self._load_cache(name) if self._touch_cache(name) else None
+            if cached:
+                return cached
+            # Cache file is unreadable: drop it and its validators, then download once
+            self._drop_cache(name)
+            validators = {}
+            data = self._make_request(url, validators=validators, check_body=True)
+            if data is NOT_MODIFIED:
+                return None
+        if data:
+            self._save_cache(name, data, validators)
+        return data
+
+    def _refresh_cache_file(self, name: str, url: str) -> bool:
+        """
+        Make sure a cache file is fresh without parsing it.
+
+        The response body is streamed straight to disk, so large responses
+        are never held in memory. Returns True if the cache file is usable.
+        """
         cache_path = self._get_cache_path(name)
+        if self._is_cache_valid(cache_path):
+            return True
+
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        validators = {}
+        result = self._make_request(
+            url,
+            conditional_headers=self._get_conditional_headers(name),
+            validators=validators,
+            stream_to=tmp_path,
+            check_body=True
+        )
+        if result is NOT_MODIFIED:
+            return self._touch_cache(name)
         try:
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(data, f)
-        except IOError:
-            pass
+            if not result:
+                return False
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            return False
+        finally:
+            # Partial or rejected downloads never replace the cache file
+            tmp_path.unlink(missing_ok=True)
+        self._mem_cache.pop(name, None)
+        self._save_cache_meta(name, validators)
+        return True
 
     def _notify_state_change(self):
         """Notify listeners of state change."""
         if self.on_state_change:
             self.on_state_change(self.state)
 
-    def _make_request(self, url: str, params: dict = None) -> Optional[dict]:
-        """Make an API request with retry logic."""
-        if self.state.should_skip():
-            return None
-
-        # Create retry decorator with current settings
-        @retry(
+    def _build_retrying(self) -> Retrying:
+        """Build the retry policy from the current settings."""
+        return Retrying(
             stop=stop_after_attempt(self.retry_attempts),
             wait=wait_fixed(self.retry_wait),
-            retry=retry_if_exception_type(requests.RequestException),
+            retry=retry_if_exception_type(httpx.HTTPError),
             reraise=True
         )
-        def do_request():
-            response = self.session.get(url, params=params, timeout=10)
-            # Check for rate limit before raising
-            if response.status_code == 429:
-                raise RateLimitError("Rate limited by API")
-            response.raise_for_status()
-            data = response.json()
-            # CoinGecko may return error in JSON body
-            if isinstance(data, dict) and "status" in data:
-                status = data["status"]
-                if isinstance(status, dict) and status.get("error_code") == 429:
-                    raise RateLimitError(status.get("error_message", "Rate limited"))
-            return data
+
+    def _check_response(self, response: httpx.Response, validators: Optional[dict]):
+        """Raise for error responses and collect validators; NOT_MODIFIED on 304."""
+        if response.status_code == 304:
+            return NOT_MODIFIED
+        # Check for rate limit before raising
+        if response.status_code == 429:
+            raise RateLimitError("Rate limited by API")
+        response.raise_for_status()
+        if validators is not None:
+            if "etag" in response.headers:
+                validators["etag"] = response.headers["etag"]
+            if "last-modified" in response.headers:
+                validators["last_modified"] = response.headers["last-modified"]
+        return None
+
+    def _do_request(
+        self,
+        url: str,
+        params: Optional[dict],
+        conditional_headers: Optional[dict],
+        validators: Optional[dict],
+        stream_to: Optional[Path] = None,
+        check_body: bool = False
+    ):
+        """Perform a single request attempt (retried by _make_request)."""
+        if stream_to is not None:
+            with self.session.stream(
+                "GET", url, params=params, headers=conditional_headers
+            ) as response:
+                if self._check_response(response, validators) is NOT_MODIFIED:
+                    return NOT_MODIFIED
+                with open(stream_to, "wb") as f:
+                    for chunk in response.iter_bytes():
+                        f.write(chunk)
+            if check_body:
+                self._check_streamed_list(stream_to)
+            return stream_to
+
+        response = self.session.get(url, params=params, headers=conditional_headers)
+        if self._check_response(response, validators) is NOT_MODIFIED:
+            return NOT_MODIFIED
+        data = response.json()
+        if check_body:
+            self._check_ratelimit_body(data)
+        return data
+
+    @classmethod
+    def _check_streamed_list(cls, path: Path):
+        """Raise unless a streamed body is a JSON array (error objects can come with HTTP 200)."""
+        with open(path, "rb") as f:
+            head = f.read(64).lstrip()
+        if head.startswith(b"["):
+            return
+        # Not a list: error bodies are small, so parse it to spot a rate limit
+        try:
+            data = _loads(path.read_bytes())
+        except ValueError:
+            data = None
+        cls._check_ratelimit_body(data)
+        raise ValueError("Unexpected response body (expected a JSON array)")
+
+    @staticmethod
+    def _check_ratelimit_body(data):
+        """Raise RateLimitError if CoinGecko reported a 429 in the JSON body."""
+        if isinstance(data, dict) and "status" in data:
+            status = data["status"]
+            if isinstance(status, dict) and status.get("error_code") == 429:
+                raise RateLimitError(status.get("error_message", "Rate limited"))
+
+    def _make_request(
+        self,
+        url: str,
+        params: dict = None,
+        conditional_headers: Optional[dict] = None,
+        validators: Optional[dict] = None,
+        stream_to: Optional[Path] = None,
+        check_body: bool = False
+    ) -> Optional[dict]:
+        """
+        Make an API request with retry logic.
+
+        Args:
+            url: Endpoint URL
+            params: Query parameters
+            conditional_headers: Extra headers for a conditional GET
+            validators: If given, filled with the response's ETag/Last-Modified
+            stream_to: If given, the raw body is streamed to this file unparsed
+            check_body: Also look for a rate-limit error in the JSON body
+                (streamed bodies must also be a JSON array)
+
+        Returns:
+            Parsed JSON (or stream_to), NOT_MODIFIED on a 304 response,
+            or None on failure
+        """
+        if self.state.should_skip():
+            return None
 
         try:
-            result = do_request()
+            for attempt in self._retrying:
+                with attempt:
+                    result = self._do_request(
+                        url, params, conditional_headers, validators,
+                        stream_to, check_body
+                    )
             self.state.record_success()
             self._notify_state_change()
             return result
@@ -156,34 +421,104 @@ class CoinGeckoAPI:
 
     def get_supported_currencies(self) -> List[str]:
         """Get list of supported vs currencies (cached 24h)."""
-        cached = self._load_cache("supported_currencies")
-        if cached:
-            return cached
-
         url = f"{self.BASE_URL}/simple/supported_vs_currencies"
-        data = self._make_request(url)
+        with self._lock:
+            data = self._fetch_cached("supported_currencies", url)
         if data:
-            self._save_cache("supported_currencies", data)
             return data
         return ["usd", "eur", "gbp", "jpy", "cad", "aud", "chf", "cny"]
 
     def get_coin_list(self) -> List[Dict]:
         """Get list of all coins (cached 24h)."""
-        cached = self._load_cache("coin_list")
-        if cached:
-            return cached
-
         url = f"{self.BASE_URL}/coins/list"
-        data = self._make_request(url)
-        if data:
-            self._save_cache("coin_list", data)
-            return data
+        with self._lock:
+            data = self._fetch_cached("coin_list", url)
+            if data:
+                self._build_symbol_index(data)
+                return data
         # Return default coins if API fails
         return [
             {"id": "bitcoin", "symbol": "btc", "name": "Bitcoin"},
             {"id": "ethereum", "symbol": "eth", "name": "Ethereum"},
         ]
 
+    def _get_index_path(self) -> Path:
+        """Get path for the pickled symbol -> id index."""
+        return self.cache_dir / "symbol_to_id.pkl"
+
+    def _build_symbol_index(self, coin_list: List[Dict]):
+        """Build the symbol -> id index from a fetched or cached coin list."""
+        self._set_symbol_index({coin["symbol"].lower(): coin["id"] for coin in coin_list})
+
+    def _stream_symbol_index(self) -> bool:
+        """Build the symbol -> id index by stream-parsing the coin list with ijson."""
+        if not self._refresh_cache_file("coin_list", f"{self.BASE_URL}/coins/list"):
+            return False
+        try:
+            # Bytes mode: ijson decodes UTF-8 itself, coins are never collected in a list
+            with open(self._get_cache_path("coin_list"), "rb") as f:
+                index = {
+                    coin["symbol"].lower(): coin["id"]
+                    for coin in ijson.items(f, "item")
+                }
+        except Exception:
+            return False
+        if not index:
+            return False
+        self._set_symbol_index(index)
+        return True
+
+    def _set_symbol_index(self, index: Dict[str, str]):
+        """Install a new symbol -> id index and persist it."""
+        if not index:
+            return  # Never replace a working index with an empty one
+        self._symbol_to_id = index
+        self._symbol_to_id_expiry = time.monotonic() + self.CACHE_DURATION.total_seconds()
+
+        # Persist the index so the next start can skip parsing the coin list
+        index_path = self._get_index_path()
+        try:
+            list_mtime = self._get_cache_path("coin_list").stat().st_mtime
+            if not index_path.exists() or index_path.stat().st_mtime < list_mtime:
+                with open(index_path, "wb") as f:
+                    pickle.dump(self._symbol_to_id, f, protocol=5)
+        except OSError:
+            pass
+
+    def _load_symbol_index(self) -> bool:
+        """Load the pickled index if it is fresh and not older than the coin list."""
+        index_path = self._get_index_path()
+        try:
+            index_mtime = index_path.stat().st_mtime
+            list_path = self._get_cache_path("coin_list")
+            if list_path.exists() and list_path.stat().st_mtime > index_mtime:
+                return False
+            remaining = self.CACHE_DURATION.total_seconds() - (time.time() - index_mtime)
+            if remaining <= 0:
+                return False
+            with open(index_path, "rb") as f:
+                index = pickle.load(f)
+        except Exception:
+            return False
+        if not isinstance(index, dict) or not index:
+            return False
+        self._symbol_to_id = index
+        self._symbol_to_id_expiry = time.monotonic() + remaining
+        return True
+
+    def _get_symbol_to_id(self) -> Dict[str, str]:
+        """Get the symbol -> id index, refreshing it once the coin list expires."""
+        if self._symbol_to_id is None and self._load_symbol_index():
+            return self._symbol_to_id
+        if self._symbol_to_id is None or time.monotonic() >= self._symbol_to_id_expiry:
+            if ijson and self._stream_symbol_index():
+                return self._symbol_to_id
+            coin_list = self.get_coin_list()
+            if self._symbol_to_id is None:
+                # API failed and nothing cached yet - use defaults without keeping them
+                return {coin["symbol"].lower(): coin["id"] for coin in coin_list}
+        return self._symbol_to_id
+
     def get_prices(self, symbols: List[str], vs_currency: str) -> Dict[str, float]:
         """
         Get prices for multiple cryptocurrencies by symbol.
@@ -201,17 +536,20 @@ class CoinGeckoAPI:
         if self.state.should_skip():
             return {}
 
-        # Get coin list to map symbols to IDs
-        coin_list = self.get_coin_list()
-        symbol_to_id = {coin["symbol"].lower(): coin["id"] for coin in coin_list}
+        with self._lock:
+            return self._get_prices_locked(symbols, vs_currency)
+
+    def _get_prices_locked(self, symbols: List[str], vs_currency: str) -> Dict[str, float]:
+        """Body of get_prices (caller holds self._lock)."""
+        # Map symbols to IDs
+        symbol_to_id = self._get_symbol_to_id()
 
         # Map requested symbols to IDs
         ids = []
         symbol_map = {}  # id -> symbol
-        for sym in symbols:
-            sym_lower = sym.lower()
-            if sym_lower in symbol_to_id:
-                coin_id = symbol_to_id[sym_lower]
+        for sym_lower in {sym.lower() for sym in symbols}:
+            coin_id = symbol_to_id.get(sym_lower)
+            if coin_id is not None:
                 ids.append(coin_id)
                 symbol_map[coin_id] = sym_lower
 
@@ -230,12 +568,38 @@ class CoinGeckoAPI:
 
         # Map back to symbols
         result = {}
+        now = time.monotonic()
         for coin_id, prices in data.items():
             if coin_id in symbol_map and vs_currency in prices:
-                result[symbol_map[coin_id]] = float(prices[vs_currency])
+                sym = symbol_map[coin_id]
+                result[sym] = price = float(prices[vs_currency])
+                self._price_cache[(sym, vs_currency)] = (now, price)
 
         return result
 
+    def get_prices_cached(
+        self, symbols: List[str], vs_currency: str
+    ) -> Tuple[Dict[str, float], bool]:
+        """
+        Get recently fetched prices without making a request.
+
+        Returns:
+            (prices, is_fresh) - is_fresh is True only if every symbol had a
+            price younger than PRICE_CACHE_SECONDS
+        """
+        cutoff = time.monotonic() - self.PRICE_CACHE_SECONDS
+        result = {}
+        is_fresh = True
+        for sym_lower in {sym.lower() for sym in symbols}:
+            entry = self._price_cache.get((sym_lower, vs_currency))
+            if entry is None:
+                is_fresh = False
+                continue
+            if entry[0] < cutoff:
+                is_fresh = False
+            result[sym_lower] = entry[1]
+        return result, is_fresh
+
     def get_price(self, symbol: str, vs_currency: str) -> Optional[float]:
         """Get price for a single cryptocurrency."""
         prices = self.get_prices([symbol], vs_currency)
@@ -259,6 +623,7 @@ class CoinGeckoAPI:
         """Update retry configuration."""
         self.retry_attempts = attempts
         self.retry_wait = wait
+        self._retrying = self._build_retrying()
 
 
 # Module-level convenience functions
@@ -289,3 +654,10 @@ def get_prices(symbols: List[str], vs_currency: str) -> Dict[str, float]:
     if _api:
         return _api.get_prices(symbols, vs_currency)
     return {}
+
+
+def get_prices_cached(symbols: List[str], vs_currency: str) -> Tuple[Dict[str, float], bool]:
+    """Convenience function to get recently fetched prices without a request."""
+    if _api:
+        return _api.get_prices_cached(symbols, vs_currency)
+    return {}, False
@@ -1,9 +1,10 @@
 """Crypto Ticker - Desktop cryptocurrency price widget."""
 
 import sys
+from dataclasses import fields
 from pathlib import Path
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import Qt, QTimer, QThread
 from PySide6.QtGui import QIcon
 
 from settings import Settings
@@ -13,7 +14,14 @@ from settings_dialog import SettingsDialog
 from about_dialog import AboutDialog
 from api import init_api, get_api
 from notifications import NotificationManager
-from price_worker import PriceWorker, PriceFetchThread
+from price_worker import PriceWorker
+
+
+# Window icon file per platform (ICO on Windows, PNG elsewhere)
+APP_ICON_FILE = "logo.ico" if sys.platform == "win32" else "logo.png"
+
+# Settings fields updated by dragging the widget, not by the settings dialog
+WINDOW_POSITION_FIELDS = ("window_corner", "window_offset_x", "window_offset_y")
 
 
 class CryptoTicker:
@@ -44,14 +52,21 @@ class CryptoTicker:
         self._settings_dialog = None
         self._about_dialog = None
         self._current_price = 0.0
-        self._fetch_thread = None
+        self._fetch_pending = False
 
         # Create price worker for background fetching
         self._price_worker = PriceWorker()
-        self._price_worker.price_fetched.connect(self._on_price_fetched)
-        self._price_worker.secondary_fetched.connect(self._on_secondary_fetched)
-        self._price_worker.fetch_error.connect(self._on_fetch_error)
-        self._price_worker.fetch_success.connect(self._on_fetch_success)
+        # CryptoTicker isn't a QObject, so auto connections would run these slots
+        # on the worker thread; queue them to the GUI thread explicitly
+        self._price_worker.prices_fetched.connect(self._on_prices_fetched, Qt.QueuedConnection)
+        self._price_worker.fetch_error.connect(self._on_fetch_error, Qt.QueuedConnection)
+        self._price_worker.fetch_success.connect(self._on_fetch_success, Qt.QueuedConnection)
+        self._price_worker.fetch_finished.connect(self._on_fetch_finished, Qt.QueuedConnection)
+
+        # Single worker thread for the lifetime of the app
+        self._worker_thread = QThread()
+        self._price_worker.moveToThread(self._worker_thread)
+        self._worker_thread.start()
 
         # Connect signals
         self._widget.settings_requested.connect(self._show_settings)
@@ -60,6 +75,10 @@ class CryptoTicker:
         self._tray.quit_requested.connect(self._quit)
         self._tray.pause_toggled.connect(self._on_pause_toggled)
         self._tray.notifications_toggled.connect(self._on_notifications_toggled)
+        # OS notifications are sent from a pool thread; the tray fallback runs on the GUI thread
+        self._notification_manager.notification_fallback.connect(
+            self._tray.show_notification, Qt.QueuedConnection
+        )
 
         # Price update timer
         self._timer = QTimer()
@@ -82,18 +101,13 @@ class CryptoTicker:
         else:
             app_dir = Path(__file__).parent
 
-        # Try formats in order: ICO (Windows), PNG, SVG
-        for ext in ['ico', 'png', 'svg']:
-            icon_path = app_dir / f"logo.{ext}"
-            if icon_path.exists():
-                icon = QIcon(str(icon_path))
-                if not icon.isNull():
-                    self.app.setWindowIcon(icon)
-                    break
+        icon = QIcon(str(app_dir / APP_ICON_FILE))
+        if not icon.isNull():
+            self.app.setWindowIcon(icon)
 
     def _on_api_state_change(self, state):
-        """Handle API state changes."""
-        self._tray.set_paused(state.should_skip())
+        """Handle API state changes (called on the thread that made the request)."""
+        self._tray.paused_state_changed.emit(state.should_skip())
 
     def _on_pause_toggled(self, paused: bool):
         """Handle pause toggle from tray."""
@@ -122,8 +136,8 @@ class CryptoTicker:
         if self._api.is_paused():
             return
 
-        # Don't start new fetch if one is already running
-        if self._fetch_thread and self._fetch_thread.isRunning():
+        # Don't queue a new fetch if one is already pending
+        if self._fetch_pending:
             return
 
         # Update worker config
@@ -133,12 +147,28 @@ class CryptoTicker:
             self.settings.secondary_cryptos
         )
 
-        # Start background fetch
-        self._fetch_thread = PriceFetchThread(self._price_worker)
-        self._fetch_thread.start()
+        # Trigger fetch on the worker thread
+        self._fetch_pending = True
+        self._price_worker.fetch_requested.emit()
+
+    def _on_fetch_finished(self):
+        """Handle background fetch completion."""
+        self._fetch_pending = False
+
+    def _on_prices_fetched(self, prices: dict):
+        """Split prices fetched from background thread into main and secondary."""
+        price = prices.get(self.settings.crypto_symbol.lower())
+        if price is not None:
+            self._on_price_fetched(price)
+
+        secondary = {
+            sym: prices[sym] for sym in self.settings.secondary_cryptos if sym in prices
+        }
+        if secondary:
+            self._on_secondary_fetched(secondary)
 
     def _on_price_fetched(self, price: float):
-        """Handle price fetched from background thread."""
+        """Handle main price update."""
         self._current_price = price
         self._widget.set_price(price)
         self._tray.set_price(price)
@@ -146,7 +176,7 @@ class CryptoTicker:
         self._notification_manager.check_price_change(price, self.settings.crypto_symbol)
 
     def _on_secondary_fetched(self, prices: dict):
-        """Handle secondary prices fetched from background thread."""
+        """Handle secondary prices update."""
         self._widget.set_secondary_prices(prices)
         self._tray.set_secondary_prices(prices)
 
@@ -180,54 +210,11 @@ class CryptoTicker:
             new_settings.vs_currency != self.settings.vs_currency
         )
 
-        # Update our settings object with all values from new_settings
-        self.settings.font_name = new_settings.font_name
-        self.settings.font_size = new_settings.font_size
-        self.settings.font_weight = new_settings.font_weight
-        self.settings.text_r = new_settings.text_r
-        self.settings.text_g = new_settings.text_g
-        self.settings.text_b = new_settings.text_b
-        self.settings.text_alpha = new_settings.text_alpha
-        self.settings.bg_r = new_settings.bg_r
-        self.settings.bg_g = new_settings.bg_g
-        self.settings.bg_b = new_settings.bg_b
-        self.settings.bg_alpha = new_settings.bg_alpha
-        self.settings.crypto_symbol = new_settings.crypto_symbol
-        self.settings.vs_currency = new_settings.vs_currency
-        self.settings.show_prefix = new_settings.show_prefix
-        self.settings.secondary_cryptos = new_settings.secondary_cryptos.copy()
-        self.settings.secondary_display = new_settings.secondary_display
-        self.settings.secondary_font_scale = new_settings.secondary_font_scale
-        self.settings.badge_font_name = new_settings.badge_font_name
-        self.settings.badge_font_weight = new_settings.badge_font_weight
-        self.settings.badge_bg_r = new_settings.badge_bg_r
-        self.settings.badge_bg_g = new_settings.badge_bg_g
-        self.settings.badge_bg_b = new_settings.badge_bg_b
-        self.settings.badge_bg_alpha = new_settings.badge_bg_alpha
-        self.settings.badge_text_r = new_settings.badge_text_r
-        self.settings.badge_text_g = new_settings.badge_text_g
-        self.settings.badge_text_b = new_settings.badge_text_b
-        self.settings.badge_text_alpha = new_settings.badge_text_alpha
-        self.settings.indicator_enabled = new_settings.indicator_enabled
-        self.settings.indicator_flash_enabled = new_settings.indicator_flash_enabled
-        self.settings.indicator_up_r = new_settings.indicator_up_r
-        self.settings.indicator_up_g = new_settings.indicator_up_g
-        self.settings.indicator_up_b = new_settings.indicator_up_b
-        self.settings.indicator_up_alpha = new_settings.indicator_up_alpha
-        self.settings.indicator_down_r = new_settings.indicator_down_r
-        self.settings.indicator_down_g = new_settings.indicator_down_g
-        self.settings.indicator_down_b = new_settings.indicator_down_b
-        self.settings.indicator_down_alpha = new_settings.indicator_down_alpha
-        self.settings.notifications_enabled = new_settings.notifications_enabled
-        self.settings.notification_threshold = new_settings.notification_threshold
-        self.settings.notification_direction = new_settings.notification_direction
-        self.settings.notification_sound = new_settings.notification_sound
-        self.settings.notification_cooldown = new_settings.notification_cooldown
-        self.settings.always_on_top = new_settings.always_on_top
-        self.settings.launch_on_startup = new_settings.launch_on_startup
-        self.settings.update_interval = new_settings.update_interval
-        self.settings.retry_attempts = new_settings.retry_attempts
-        self.settings.retry_wait = new_settings.retry_wait
+        # Update our settings object with all values from new_settings,
+        # except the window position which is owned by the widget (drag)
+        for f in fields(Settings):
+            if f.name not in WINDOW_POSITION_FIELDS:
+                setattr(self.settings, f.name, getattr(new_settings, f.name))
 
         # Apply to widget, tray, and notification manager
         self._widget.apply_settings(self.settings)
@@ -258,12 +245,20 @@ class CryptoTicker:
     def _on_settings_closed(self, result):
         """Handle settings dialog closed."""
         if result == SettingsDialog.Accepted:
-            # Settings were saved - reload from file
-            self.settings = Settings.load()
+            # Settings were saved - take them from the dialog (the file may still be being written)
+            new_settings = self._settings_dialog.get_settings()
+            crypto_changed = (
+                new_settings.crypto_symbol != self.settings.crypto_symbol or
+                new_settings.vs_currency != self.settings.vs_currency
+            )
+            self.settings = new_settings
             self._widget.settings = self.settings
             self._tray.settings = self.settings
             self._widget.apply_settings(self.settings)
             self._tray.apply_settings(self.settings)
+            self._notification_manager.apply_settings(self.settings)
+            if crypto_changed:
+                self._notification_manager.reset_last_price()
             self._api.update_retry_settings(
                 self.settings.retry_attempts,
                 self.settings.retry_wait
@@ -284,6 +279,8 @@ class CryptoTicker:
     def _quit(self):
         """Quit the application."""
         self._tray.hide()
+        self._worker_thread.quit()
+        self._worker_thread.wait(3000)
         self.app.quit()
 
     def run(self) -> int:
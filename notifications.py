@@ -1,33 +1,68 @@
 """Notification module for price change alerts."""
 
+import logging
 import sys
-import os
+import subprocess
+import time
+from collections import deque
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Deque, Dict, Tuple
 
-from PySide6.QtCore import QObject, Signal, QUrl
+from PySide6.QtCore import QObject, Signal, QUrl, QThreadPool
 from PySide6.QtMultimedia import QSoundEffect
 
 from settings import Settings
 
+try:
+    from jeepney import DBusAddress, new_method_call
+    from jeepney.io.blocking import open_dbus_connection
+except ImportError:  # Optional: falls back to notify-send
+    open_dbus_connection = None
+
+logger = logging.getLogger(__name__)
+
+
+# At most this many alerts per minute, across all symbols and directions
+MAX_NOTIFICATIONS_PER_MINUTE = 3
+
+# Show a notification without spawning a shell; title and message are passed as argv
+MACOS_NOTIFY_SCRIPT = (
+    "-e", "on run argv",
+    "-e", "display notification (item 2 of argv) with title (item 1 of argv)",
+    "-e", "end run",
+)
+
 
 class NotificationManager(QObject):
     """Manages price change notifications with rate limiting."""
 
     notification_triggered = Signal(str, str)  # title, message
+    notification_fallback = Signal(str, str)  # OS notification failed; show via tray instead
 
     def __init__(self, settings: Settings, parent=None):
         super().__init__(parent)
         self.settings = settings
         self._last_price: Optional[float] = None
-        self._last_notification_time: Optional[datetime] = None
+        # time.monotonic() of recent alerts, and of the last alert per (symbol, direction)
+        self._recent_pushes: Deque[float] = deque(maxlen=MAX_NOTIFICATIONS_PER_MINUTE)
+        self._last_push_by_thread: Dict[Tuple[str, int], float] = {}
+        self._cooldown_seconds = settings.notification_cooldown * 60.0
         self._sound_effect: Optional[QSoundEffect] = None
+        self._cached_sound_setting: Optional[str] = None
+        self._cached_sound_url: Optional[QUrl] = None
+        self._toaster = None
+        self._dbus_connection = None
+        self._dbus_failed = False
+        # One thread keeps OS calls off the GUI thread and alerts in order
+        self._notify_pool = QThreadPool(self)
+        self._notify_pool.setMaxThreadCount(1)
         self._setup_sound()
 
     def _setup_sound(self):
         """Set up sound effect for notifications."""
         self._sound_effect = QSoundEffect(self)
+        self._sound_effect.setVolume(1.0)
+        self._sound_effect.setLoopCount(1)
 
     def _get_sound_path(self) -> Optional[Path]:
         """Get the full path to the notification sound file."""
@@ -52,22 +87,34 @@ class NotificationManager(QObject):
 
     def _play_sound(self):
         """Play notification sound if configured."""
-        sound_path = self._get_sound_path()
-        if sound_path and self._sound_effect:
-            url = QUrl.fromLocalFile(str(sound_path))
-            self._sound_effect.setSource(url)
+        if not self._sound_effect:
+            return
+        # Only resolve and load the file when the configured sound changes
+        if self.settings.notification_sound != self._cached_sound_setting:
+            self._cached_sound_setting = self.settings.notification_sound
+            sound_path = self._get_sound_path()
+            self._cached_sound_url = QUrl.fromLocalFile(str(sound_path)) if sound_path else None
+            self._sound_effect.setSource(self._cached_sound_url or QUrl())
+        if self._cached_sound_url:
             self._sound_effect.play()
 
-    def _can_notify(self) -> bool:
-        """Check if enough time has passed since last notification."""
-        if self._last_notification_time is None:
-            return True
+    def _can_notify(self, thread_key: Tuple[str, int], now: float) -> bool:
+        """Check the per-minute rate limit and the cooldown for this kind of alert."""
+        recent = self._recent_pushes
+        while recent and recent[0] <= now - 60.0:
+            recent.popleft()
+        if len(recent) >= MAX_NOTIFICATIONS_PER_MINUTE:
+            return False
 
-        cooldown = timedelta(minutes=self.settings.notification_cooldown)
-        return datetime.now() - self._last_notification_time >= cooldown
+        last = self._last_push_by_thread.get(thread_key)
+        return last is None or now - last >= self._cooldown_seconds
 
     def _send_system_notification(self, title: str, message: str):
-        """Send OS-level notification."""
+        """Send OS-level notification from the notification thread."""
+        self._notify_pool.start(lambda: self._dispatch_system_notification(title, message))
+
+    def _dispatch_system_notification(self, title: str, message: str):
+        """Send OS-level notification (blocking)."""
         try:
             if sys.platform == "win32":
                 self._send_windows_notification(title, message)
@@ -76,31 +123,71 @@ class NotificationManager(QObject):
             else:
                 self._send_linux_notification(title, message)
         except Exception as e:
-            print(f"Notification error: {e}")
+            logger.warning("Notification error: %s", e)
 
     def _send_windows_notification(self, title: str, message: str):
         """Send Windows toast notification."""
         try:
-            from win10toast import ToastNotifier
-            toaster = ToastNotifier()
-            toaster.show_toast(title, message, duration=5, threaded=True)
+            if self._toaster is None:
+                # Constructing ToastNotifier creates a hidden window, so keep one
+                from win10toast import ToastNotifier
+                self._toaster = ToastNotifier()
+            # Refused (returns False) while the previous toast is still showing
+            if not self._toaster.show_toast(title, message, duration=5, threaded=True):
+                self.notification_fallback.emit(title, message)
         except ImportError:
-            # Fallback to system tray notification (handled by tray.py)
-            self.notification_triggered.emit(title, message)
+            # Fallback to system tray notification (shown by tray.py)
+            self.notification_fallback.emit(title, message)
 
     def _send_macos_notification(self, title: str, message: str):
         """Send macOS notification."""
         try:
-            os.system(f'''osascript -e 'display notification "{message}" with title "{title}"' ''')
+            subprocess.Popen(
+                ["osascript", *MACOS_NOTIFY_SCRIPT, title, message],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True
+            )
         except Exception:
-            self.notification_triggered.emit(title, message)
+            self.notification_fallback.emit(title, message)
+
+    def _send_dbus_notification(self, title: str, message: str) -> bool:
+        """Send a notification over D-Bus. Returns False if D-Bus is unavailable."""
+        if open_dbus_connection is None or self._dbus_failed:
+            return False
+        try:
+            if self._dbus_connection is None:
+                self._dbus_connection = open_dbus_connection(bus="SESSION")
+            address = DBusAddress(
+                "/org/freedesktop/Notifications",
+                bus_name="org.freedesktop.Notifications",
+                interface="org.freedesktop.Notifications"
+            )
+            msg = new_method_call(
+                address, "Notify", "susssasa{sv}i",
+                ("Crypto Ticker", 0, "", title, message, [], {}, 5000)
+            )
+            self._dbus_connection.send_and_get_reply(msg, timeout=2)
+            return True
+        except Exception:
+            # No session bus or notification daemon - don't try again
+            self._dbus_failed = True
+            self._dbus_connection = None
+            return False
 
     def _send_linux_notification(self, title: str, message: str):
         """Send Linux notification."""
+        if self._send_dbus_notification(title, message):
+            return
         try:
-            os.system(f'notify-send "{title}" "{message}"')
+            subprocess.Popen(
+                ["notify-send", title, message],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True
+            )
         except Exception:
-            self.notification_triggered.emit(title, message)
+            self.notification_fallback.emit(title, message)
 
     def check_price_change(self, current_price: float, symbol: str) -> bool:
         """
@@ -131,13 +218,16 @@ class NotificationManager(QObject):
             self._last_price = current_price
             return False
 
-        # Check cooldown
-        if not self._can_notify():
+        # Check rate limit and cooldown (same symbol moving the same way)
+        now = time.monotonic()
+        thread_key = (symbol.lower(), 1 if change_percent > 0 else -1)
+        if not self._can_notify(thread_key, now):
             return False
 
         # Send notification
         self._last_price = current_price
-        self._last_notification_time = datetime.now()
+        self._recent_pushes.append(now)
+        self._last_push_by_thread[thread_key] = now
 
         # Format message
         direction_emoji = "+" if change_percent > 0 else ""
@@ -157,3 +247,5 @@ class NotificationManager(QObject):
     def apply_settings(self, settings: Settings):
         """Apply new settings."""
         self.settings = settings
+        self._cooldown_seconds = settings.notification_cooldown * 60.0
+        self._cached_sound_setting = None
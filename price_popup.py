@@ -1,11 +1,16 @@
 """Custom popup widget for secondary cryptocurrency prices."""
 
+import bisect
+
 from PySide6.QtWidgets import QWidget, QGridLayout, QLabel, QApplication
-from PySide6.QtCore import Qt, QRectF
-from PySide6.QtGui import QFont, QColor, QPainter, QBrush, QFontMetrics, QFontDatabase
+from PySide6.QtCore import Qt, QRectF, QTimer, QPointF, QSize, QEvent
+from PySide6.QtGui import (
+    QFont, QColor, QPainter, QBrush, QFontMetrics, QFontDatabase, QPalette, QPixmap,
+    QStaticText, QTransform
+)
 
 from settings import Settings
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 # Layout constants (must match widget.py)
 MOVE_BUTTON_SIZE = 24
@@ -20,18 +25,88 @@ BADGE_SIZE_SCALE = 0.95  # 5% smaller badge (text and rectangle)
 BADGE_RECT_SIZE_SCALE = 0.85 # 15% smaller rectangle (overall)
 BADGE_CORNER_SCALE = 1.1  # 10% bigger corner radius
 
+# Numeric font weight (100-900) -> Qt weight: first threshold >= weight wins
+_WEIGHT_THRESHOLDS = (100, 200, 300, 400, 500, 600, 700, 800)
+_WEIGHT_VALUES = (
+    QFont.Thin, QFont.ExtraLight, QFont.Light, QFont.Normal,
+    QFont.Medium, QFont.DemiBold, QFont.Bold, QFont.ExtraBold, QFont.Black,
+)
+
+
+def qt_font_weight(weight: int) -> QFont.Weight:
+    """Convert numeric weight to Qt weight."""
+    return _WEIGHT_VALUES[bisect.bisect_left(_WEIGHT_THRESHOLDS, weight)]
+
+
+def qt_color(rgb: int, alpha: int) -> QColor:
+    """Convert a packed 0xRRGGBB setting and 0-100 opacity to a QColor."""
+    return QColor((rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF, int(alpha * 2.55))
+
+
+def render_rounded_background(
+    widget: QWidget, rect: QRectF, color: QColor, radius: float
+) -> QPixmap:
+    """Rasterize an antialiased rounded rect the size of widget, at its device pixel ratio."""
+    dpr = widget.devicePixelRatioF()
+    pixmap = QPixmap(int(widget.width() * dpr), int(widget.height() * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setBrush(QBrush(color))
+    painter.setPen(Qt.NoPen)
+    painter.drawRoundedRect(rect, radius, radius)
+    painter.end()
+    return pixmap
+
 
 class SymbolBadge(QWidget):
     """A rounded rectangle badge displaying a crypto symbol."""
 
-    def __init__(self, symbol: str, settings: Settings, target_height: int, parent=None):
+    def __init__(
+        self,
+        symbol: str,
+        settings: Settings,
+        target_height: int,
+        parent=None,
+        font: Optional[QFont] = None,
+        text_width: Optional[int] = None
+    ):
         super().__init__(parent)
         self.symbol = symbol.upper()
         self.settings = settings
         self.target_height = target_height
 
         self.setAttribute(Qt.WA_TranslucentBackground)
+        self.invalidate_style(font, text_width)
+
+    def invalidate_style(self, font: Optional[QFont] = None, text_width: Optional[int] = None):
+        """
+        Recompute cached font, colors, size and corner radius from settings.
+
+        A precomputed fit_font() result and symbol advance can be passed in
+        to skip the font fitting and text measuring.
+        """
+        self._cached_font = font or self.fit_font(self.settings, self.target_height)
+        self._text_width = text_width
+        self._cached_bg = self._get_bg_color()
+        self._cached_text = self._get_text_color()
         self._calculate_size()
+        self._cached_corner = self._get_corner_radius()
+        self._bg_pixmap = None
+        self.update()
+
+    def resizeEvent(self, event):
+        """Drop the cached background when the size changes."""
+        self._bg_pixmap = None
+        super().resizeEvent(event)
+
+    def _repaint_bg(self):
+        """Render the rounded background into the cached pixmap."""
+        self._bg_pixmap = render_rounded_background(
+            self, QRectF(0, 0, self.width(), self.height()),
+            self._cached_bg, self._cached_corner
+        )
 
     def _calculate_size(self):
         """Calculate badge size based on target height (5% smaller)."""
@@ -39,10 +114,9 @@ class SymbolBadge(QWidget):
         scaled_height = int(self.target_height * BADGE_SIZE_SCALE * BADGE_RECT_SIZE_SCALE)
 
         # Text font is smaller to fit with padding
-        font = self._get_font()
-        fm = QFontMetrics(font)
-
-        text_width = fm.horizontalAdvance(self.symbol)
+        text_width = self._text_width
+        if text_width is None:
+            text_width = QFontMetrics(self._cached_font).horizontalAdvance(self.symbol)
 
         # Badge size: text + padding, scaled down 5%
         badge_width = text_width + (BADGE_PADDING_H * 2)
@@ -50,19 +124,20 @@ class SymbolBadge(QWidget):
 
         self.setFixedSize(int(badge_width), int(badge_height))
 
-    def _get_font(self) -> QFont:
-        """Get font sized to fit in badge with padding."""
+    @classmethod
+    def fit_font(cls, settings: Settings, target_height: int) -> QFont:
+        """Get font sized to fit in a badge of target_height with padding."""
         # Start with base font, scale down to fit target height with padding
-        scale = max(0.1, min(3.0, self.settings.secondary_font_scale))
-        base_size = max(8, int(self.settings.font_size * scale * BADGE_SIZE_SCALE))
+        scale = max(10, min(300, settings.secondary_font_scale_pct)) / 100
+        base_size = max(8, int(settings.font_size * scale * BADGE_SIZE_SCALE))
 
         # Reduce font size to account for vertical padding
-        scaled_height = int(self.target_height * BADGE_SIZE_SCALE)
+        scaled_height = int(target_height * BADGE_SIZE_SCALE)
         available_height = scaled_height - (BADGE_PADDING_V * 2)
 
         # Use badge-specific font and weight
-        font = QFont(self.settings.badge_font_name, base_size)
-        font.setWeight(self._qt_font_weight(self.settings.badge_font_weight))
+        font = QFont(settings.badge_font_name, base_size)
+        font.setWeight(qt_font_weight(settings.badge_font_weight))
 
         # Iteratively reduce font size until it fits
         fm = QFontMetrics(font)
@@ -77,70 +152,85 @@ class SymbolBadge(QWidget):
         base_radius = min(self.width(), self.height()) / 4
         return base_radius * BADGE_CORNER_SCALE
 
-    def _qt_font_weight(self, weight: int) -> QFont.Weight:
-        """Convert numeric weight to Qt weight."""
-        if weight <= 100:
-            return QFont.Thin
-        elif weight <= 200:
-            return QFont.ExtraLight
-        elif weight <= 300:
-            return QFont.Light
-        elif weight <= 400:
-            return QFont.Normal
-        elif weight <= 500:
-            return QFont.Medium
-        elif weight <= 600:
-            return QFont.DemiBold
-        elif weight <= 700:
-            return QFont.Bold
-        elif weight <= 800:
-            return QFont.ExtraBold
-        else:
-            return QFont.Black
-
     def _get_bg_color(self) -> QColor:
         """Get badge background color."""
-        return QColor(
-            self.settings.badge_bg_r,
-            self.settings.badge_bg_g,
-            self.settings.badge_bg_b,
-            int(self.settings.badge_bg_alpha * 2.55)
-        )
+        return qt_color(self.settings.badge_bg_rgb, self.settings.badge_bg_alpha)
 
     def _get_text_color(self) -> QColor:
         """Get badge text color."""
-        return QColor(
-            self.settings.badge_text_r,
-            self.settings.badge_text_g,
-            self.settings.badge_text_b,
-            int(self.settings.badge_text_alpha * 2.55)
-        )
+        return qt_color(self.settings.badge_text_rgb, self.settings.badge_text_alpha)
 
     def paintEvent(self, event):
         """Paint the badge with rounded rectangle background and text."""
+        # Rounded rectangle background is rasterized once and blitted
+        if self._bg_pixmap is None or self._bg_pixmap.devicePixelRatio() != self.devicePixelRatioF():
+            self._repaint_bg()
+
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         painter.setRenderHint(QPainter.TextAntialiasing)
-
-        corner_radius = self._get_corner_radius()
-
-        # Draw rounded rectangle background
-        bg_color = self._get_bg_color()
-        painter.setBrush(QBrush(bg_color))
-        painter.setPen(Qt.NoPen)
-        rect = QRectF(0, 0, self.width(), self.height())
-        painter.drawRoundedRect(rect, corner_radius, corner_radius)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
 
         # Draw text centered
-        text_color = self._get_text_color()
-        painter.setPen(text_color)
-        font = self._get_font()
-        painter.setFont(font)
+        rect = QRectF(0, 0, self.width(), self.height())
+        painter.setPen(self._cached_text)
+        painter.setFont(self._cached_font)
         painter.drawText(rect, Qt.AlignCenter, self.symbol)
 
         painter.end()
 
 
+class PriceLabel(QWidget):
+    """Right-aligned text label drawn from a QStaticText, so glyph layout is only redone on change."""
+
+    def __init__(self, text: str, parent=None):
+        super().__init__(parent)
+        self._static_text = QStaticText()
+        self._static_text.setTextFormat(Qt.PlainText)
+        self.setText(text)
+
+    def text(self) -> str:
+        """Get the displayed text."""
+        return self._static_text.text()
+
+    def setText(self, text: str):
+        """Set the displayed text (no-op if unchanged)."""
+        if text == self._static_text.text():
+            return
+        self._static_text.setText(text)
+        self._static_text.prepare(QTransform(), self.font())
+        self.updateGeometry()
+        self.update()
+
+    def changeEvent(self, event):
+        """Re-prepare the text layout when the font changes."""
+        if event.type() == QEvent.FontChange:
+            self._static_text.prepare(QTransform(), self.font())
+            self.updateGeometry()
+        super().changeEvent(event)
+
+    def sizeHint(self) -> QSize:
+        """Size of the text in the current font."""
+        fm = QFontMetrics(self.font())
+        return QSize(fm.horizontalAdvance(self.text()), fm.height())
+
+    def minimumSizeHint(self) -> QSize:
+        """Never shrink below the text size."""
+        return self.sizeHint()
+
+    def paintEvent(self, event):
+        """Draw the text right-aligned and vertically centered."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(QPalette.WindowText))
+        size = self._static_text.size()
+        painter.drawStaticText(
+            QPointF(self.width() - size.width(), (self.height() - size.height()) / 2),
+            self._static_text
+        )
+        painter.end()
+
+
 class PricePopup(QWidget):
     """Floating popup showing secondary crypto prices."""
 
@@ -149,10 +239,30 @@ class PricePopup(QWidget):
         self.settings = settings
         self._prices: Dict[str, float] = {}
         self._labels: list[QLabel] = []
+        self._price_labels: Dict[str, PriceLabel] = {}  # symbol -> price label, in row order
+        self._labels_stale = True  # Prices/settings changed while hidden, rebuild on show
+        self._arrow_font_cache: Dict[int, Tuple[QFont, int]] = {}  # pt size -> (font, offset)
+        self._badge_advance_cache: Dict[Tuple[str, str], int] = {}  # (font key, symbol) -> width
         self._anchor_widget = None
         self._show_above = False  # Track if popup should be above anchor
         self._direction = 0  # Test direction: 1=up, -1=down, 0=none
 
+        # Inputs of the last _reposition and the primary screen's available area
+        self._last_reposition_key = None
+        self._cached_screen_geo = None
+        self._watched_screen = None
+        QApplication.instance().primaryScreenChanged.connect(self._invalidate_screen_geometry)
+
+        # Cached background: (size, dpr, color, radius) it was rendered for, pixmap
+        self._bg_key = None
+        self._bg_pixmap = None
+
+        # Reused zero-delay timer for the deferred reposition after a rebuild
+        self._reposition_timer = QTimer(self)
+        self._reposition_timer.setSingleShot(True)
+        self._reposition_timer.setInterval(0)
+        self._reposition_timer.timeout.connect(self._reposition)
+
         self._setup_window()
         self._setup_ui()
 
@@ -178,28 +288,18 @@ class PricePopup(QWidget):
 
     def _get_text_color(self) -> QColor:
         """Get text color from settings."""
-        return QColor(
-            self.settings.text_r,
-            self.settings.text_g,
-            self.settings.text_b,
-            int(self.settings.text_alpha * 2.55)
-        )
+        return qt_color(self.settings.text_rgb, self.settings.text_alpha)
 
     def _get_bg_color(self) -> QColor:
         """Get background color from settings (matches main window)."""
-        return QColor(
-            self.settings.bg_r,
-            self.settings.bg_g,
-            self.settings.bg_b,
-            int(self.settings.bg_alpha * 2.55)
-        )
+        return qt_color(self.settings.bg_rgb, self.settings.bg_alpha)
 
     def _get_font(self) -> QFont:
         """Get font from settings with scale applied."""
-        scale = max(0.1, min(3.0, self.settings.secondary_font_scale))
+        scale = max(10, min(300, self.settings.secondary_font_scale_pct)) / 100
         size = max(8, int(self.settings.font_size * scale))
         font = QFont(self.settings.font_name, size)
-        font.setWeight(self._qt_font_weight(self.settings.font_weight))
+        font.setWeight(qt_font_weight(self.settings.font_weight))
         return font
 
     def _get_corner_radius(self) -> float:
@@ -209,56 +309,58 @@ class PricePopup(QWidget):
             return self._anchor_widget.height() / 2
         return self.height() / 2
 
-    def _qt_font_weight(self, weight: int) -> QFont.Weight:
-        """Convert numeric weight to Qt weight."""
-        if weight <= 100:
-            return QFont.Thin
-        elif weight <= 200:
-            return QFont.ExtraLight
-        elif weight <= 300:
-            return QFont.Light
-        elif weight <= 400:
-            return QFont.Normal
-        elif weight <= 500:
-            return QFont.Medium
-        elif weight <= 600:
-            return QFont.DemiBold
-        elif weight <= 700:
-            return QFont.Bold
-        elif weight <= 800:
-            return QFont.ExtraBold
-        else:
-            return QFont.Black
-
     def set_prices(self, prices: Dict[str, float]):
         """Update the displayed prices."""
+        if prices == self._prices:
+            return
         self._prices = prices
+
+        # Same rows as before: just update the price texts in place
+        shown = [symbol for symbol, price in prices.items() if price > 0]
+        if shown and shown == list(self._price_labels):
+            for symbol in shown:
+                self._price_labels[symbol].setText(f"${prices[symbol]:,.2f}")
+            return
+
+        # Hidden: show_below_anchor rebuilds once when the popup appears
+        if not self.isVisible():
+            self._labels_stale = True
+            return
         self._rebuild_labels()
 
     def _get_arrow_color(self) -> QColor:
         """Get arrow color based on direction."""
         if self._direction > 0:
-            return QColor(
-                self.settings.indicator_up_r,
-                self.settings.indicator_up_g,
-                self.settings.indicator_up_b,
-                int(self.settings.indicator_up_alpha * 2.55)
-            )
+            return qt_color(self.settings.indicator_up_rgb, self.settings.indicator_up_alpha)
         else:
-            return QColor(
-                self.settings.indicator_down_r,
-                self.settings.indicator_down_g,
-                self.settings.indicator_down_b,
-                int(self.settings.indicator_down_alpha * 2.55)
-            )
+            return qt_color(self.settings.indicator_down_rgb, self.settings.indicator_down_alpha)
+
+    @staticmethod
+    def _text_palette(color: QColor) -> QPalette:
+        """Palette with the given text color (labels don't fill their background)."""
+        palette = QPalette()
+        palette.setColor(QPalette.WindowText, color)
+        return palette
+
+    def _get_arrow_font(self, point_size: int) -> Tuple[QFont, int]:
+        """Get the (cached) arrow font and its vertical offset for a price font size."""
+        cached = self._arrow_font_cache.get(point_size)
+        if cached is None:
+            arrow_font = QFontDatabase.systemFont(QFontDatabase.GeneralFont)
+            arrow_font.setPointSize(point_size - (point_size // 4))
+            cached = (arrow_font, QFontMetrics(arrow_font).height() // 10)
+            self._arrow_font_cache[point_size] = cached
+        return cached
 
     def _rebuild_labels(self):
         """Rebuild price labels in aligned columns."""
+        self._labels_stale = False
         # Clear existing widgets
         for widget in self._labels:
             self._layout.removeWidget(widget)
             widget.deleteLater()
         self._labels.clear()
+        self._price_labels.clear()
 
         if not self._prices:
             self.hide()
@@ -266,46 +368,54 @@ class PricePopup(QWidget):
 
         font = self._get_font()
         color = self._get_text_color()
-        style = f"color: rgba({color.red()}, {color.green()}, {color.blue()}, {color.alpha()}); background: transparent;"
+        palette = self._text_palette(color)
 
         # Get price label height to match badge height
         fm = QFontMetrics(font)
         target_height = fm.height()
 
+        # All badges share one fitted font; symbol widths are cached per font
+        badge_font = SymbolBadge.fit_font(self.settings, target_height)
+        badge_font_key = badge_font.key()
+        badge_fm = QFontMetrics(badge_font)
+
         # Check if we should show arrows
         has_arrow = self._direction != 0 and self.settings.indicator_enabled
         arrow_char = "\u2191" if self._direction > 0 else "\u2193"
         arrow_color = self._get_arrow_color() if has_arrow else None
+        if has_arrow:
+            arrow_font, vertical_offset = self._get_arrow_font(font.pointSize())
+            arrow_palette = self._text_palette(arrow_color)
 
         row = 0
         for symbol, price in self._prices.items():
             if price > 0:
                 # Symbol badge (rounded rectangle with symbol)
-                badge = SymbolBadge(symbol, self.settings, target_height, self)
+                advance_key = (badge_font_key, symbol)
+                text_width = self._badge_advance_cache.get(advance_key)
+                if text_width is None:
+                    text_width = badge_fm.horizontalAdvance(symbol.upper())
+                    self._badge_advance_cache[advance_key] = text_width
+                badge = SymbolBadge(
+                    symbol, self.settings, target_height, self,
+                    font=badge_font, text_width=text_width
+                )
                 self._layout.addWidget(badge, row, 0, Qt.AlignLeft | Qt.AlignVCenter)
                 self._labels.append(badge)
 
                 # Price label (right aligned)
-                price_label = QLabel(f"${price:,.2f}")
+                price_label = PriceLabel(f"${price:,.2f}")
                 price_label.setFont(font)
-                price_label.setStyleSheet(style)
-                price_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                price_label.setPalette(palette)
                 self._layout.addWidget(price_label, row, 1)
                 self._labels.append(price_label)
+                self._price_labels[symbol] = price_label
 
                 if has_arrow:
                     arrow_label = QLabel(arrow_char)
-                    arrow_font = QFontDatabase.systemFont(QFontDatabase.GeneralFont)
-                    arrow_font.setPointSize(font.pointSize() - (font.pointSize() // 4))
                     arrow_label.setFont(arrow_font)
-
-                    # Color only, no padding in stylesheet
-                    arrow_style = f"color: rgba({arrow_color.red()}, {arrow_color.green()}, {arrow_color.blue()}, {arrow_color.alpha()}); background: transparent;"
-                    arrow_label.setStyleSheet(arrow_style)
-
+                    arrow_label.setPalette(arrow_palette)
                     # Vertical offset using margins (same method as widget)
-                    arrow_fm = QFontMetrics(arrow_font)
-                    vertical_offset = arrow_fm.height() // 10
                     arrow_label.setContentsMargins(0, 0, 0, vertical_offset)
 
                     arrow_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
@@ -315,19 +425,41 @@ class PricePopup(QWidget):
                 row += 1
 
         self.adjustSize()
+        self._last_reposition_key = None
         # Defer reposition to after layout is complete
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(0, self._reposition)
+        self._reposition_timer.start()
 
     def apply_settings(self, settings: Settings):
         """Apply new settings."""
         self.settings = settings
+        self._arrow_font_cache.clear()
+        self._badge_advance_cache.clear()
+        if not self.isVisible():
+            self._labels_stale = True
+            return
         self._rebuild_labels()
 
     def set_anchor_widget(self, widget: QWidget):
         """Set the widget to anchor below."""
         self._anchor_widget = widget
 
+    def _invalidate_screen_geometry(self, *args):
+        """Forget the cached screen area (primary screen or its work area changed)."""
+        self._cached_screen_geo = None
+        self._last_reposition_key = None
+
+    def _get_screen_geometry(self):
+        """Get the primary screen's available geometry (cached), or None."""
+        if self._cached_screen_geo is None:
+            screen = QApplication.primaryScreen()
+            if not screen:
+                return None
+            if screen is not self._watched_screen:
+                screen.availableGeometryChanged.connect(self._invalidate_screen_geometry)
+                self._watched_screen = screen
+            self._cached_screen_geo = screen.availableGeometry()
+        return self._cached_screen_geo
+
     def _reposition(self):
         """Position popup relative to anchor widget, remembering above/below preference."""
         if not self._anchor_widget or not self._anchor_widget.isVisible():
@@ -337,14 +469,19 @@ class PricePopup(QWidget):
         anchor_pos = self._anchor_widget.pos()
         anchor_size = self._anchor_widget.size()
 
+        # Nothing moved or resized since the last call: position is still right
+        reposition_key = (anchor_pos, anchor_size, self.size())
+        if reposition_key == self._last_reposition_key:
+            return
+        self._last_reposition_key = reposition_key
+
         # Align popup text with main widget text
         pill_x = MOVE_BUTTON_SIZE - MOVE_BUTTON_OVERLAP
         x = anchor_pos.x() + pill_x
 
         # Check screen bounds to determine if we should be above or below
-        screen = QApplication.primaryScreen()
-        if screen:
-            screen_geo = screen.availableGeometry()
+        screen_geo = self._get_screen_geometry()
+        if screen_geo is not None:
 
             # Get actual dimensions (deferred call ensures layout is complete)
             popup_height = self.height() if self.height() > 0 else self.sizeHint().height()
@@ -388,8 +525,12 @@ class PricePopup(QWidget):
         """Show popup positioned below anchor widget."""
         if not self._prices:
             return
-        self._rebuild_labels()
-        self.show()
+        if self._labels_stale:
+            self._rebuild_labels()  # Repositions once the layout settles
+            self.show()
+        else:
+            self.show()
+            self._reposition()  # The anchor may have moved while hidden
         self.raise_()
 
     def update_position(self):
@@ -399,22 +540,25 @@ class PricePopup(QWidget):
 
     def paintEvent(self, event):
         """Paint the popup background (no border, matches main window non-hover state)."""
+        # Background only (border only shows during drag on main window)
+        self._repaint_bg()
+
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        painter.end()
 
+    def _repaint_bg(self):
+        """Re-render the cached background if its size, color or radius changed."""
         corner_radius = self._get_corner_radius()
-
-        # Background only (border only shows during drag on main window)
         bg_color = self._get_bg_color()
-        painter.setBrush(QBrush(bg_color))
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(
-            self.rect().adjusted(1, 1, -1, -1),
-            corner_radius, corner_radius
+        key = (self.size(), self.devicePixelRatioF(), bg_color.rgba(), corner_radius)
+        if key == self._bg_key:
+            return
+        self._bg_key = key
+        self._bg_pixmap = render_rounded_background(
+            self, QRectF(self.rect().adjusted(1, 1, -1, -1)), bg_color, corner_radius
         )
 
-        painter.end()
-
     def set_direction(self, direction: int):
         """Set test direction state for all prices (for keyboard testing)."""
         # Direction: 1 = up, -1 = down, 0 = none
@@ -1,77 +1,69 @@
 """Background worker for fetching prices without blocking UI."""
 
-from PySide6.QtCore import QObject, Signal, QThread, QMutex
-from typing import Dict, List, Optional
+from PySide6.QtCore import QObject, Signal, Slot, Qt
+from typing import Dict, List, Tuple
 
 
 class PriceWorker(QObject):
-    """Worker that fetches prices in a background thread."""
+    """Worker that fetches prices on a long-lived background thread."""
 
     # Signals
-    price_fetched = Signal(float)  # Main price
-    secondary_fetched = Signal(dict)  # Secondary prices {symbol: price}
+    fetch_requested = Signal()  # Emit from any thread to trigger a fetch
+    fetch_finished = Signal()  # Fetch attempt completed (success or not)
+    prices_fetched = Signal(dict)  # Main and secondary prices {symbol: price}
     fetch_error = Signal(str)  # Error message
     fetch_success = Signal()  # Successful fetch (clears error state)
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._symbol = "btc"
-        self._vs_currency = "usd"
-        self._secondary_symbols: List[str] = []
-        self._mutex = QMutex()
+        # (symbol, vs_currency, secondary symbols), replaced as a whole by set_config
+        self._config: Tuple[str, str, Tuple[str, ...]] = ("btc", "usd", ())
+        self._last_prices: Dict[str, float] = {}  # Last emitted prices (worker thread only)
+        # Always queued, so fetch runs on the worker's thread after moveToThread()
+        self.fetch_requested.connect(self.fetch, Qt.QueuedConnection)
 
     def set_config(self, symbol: str, vs_currency: str, secondary: List[str]):
-        """Update fetch configuration (thread-safe)."""
-        self._mutex.lock()
-        self._symbol = symbol
-        self._vs_currency = vs_currency
-        self._secondary_symbols = secondary.copy()
-        self._mutex.unlock()
+        """Update fetch configuration (thread-safe: one atomic attribute swap)."""
+        self._config = (symbol, vs_currency, tuple(secondary))
 
+    @Slot()
     def fetch(self):
         """Fetch prices - called from worker thread."""
-        from api import get_price, get_prices, get_api
+        from api import get_prices, get_prices_cached, get_api
 
-        self._mutex.lock()
-        symbol = self._symbol
-        vs_currency = self._vs_currency
-        secondary = self._secondary_symbols.copy()
-        self._mutex.unlock()
+        symbol, vs_currency, secondary = self._config
+        symbols = [symbol, *secondary]
+
+        # Recently fetched prices are reused without touching the API
+        prices, is_fresh = get_prices_cached(symbols, vs_currency)
+        if is_fresh:
+            self._emit_prices(prices)
+            self.fetch_success.emit()
+            self.fetch_finished.emit()
+            return
 
         api = get_api()
         if api and api.is_paused():
+            self.fetch_finished.emit()
             return
 
         try:
-            # Fetch main price
-            price = get_price(symbol, vs_currency)
-            if price is not None:
-                self.price_fetched.emit(price)
+            # Main and secondary prices in a single request
+            prices = get_prices(symbols, vs_currency)
+            if prices:
+                self._emit_prices(prices)
+            if symbol.lower() in prices:
                 self.fetch_success.emit()
-            else:
-                # Check if there was an error
-                if api and api.state.last_error:
-                    self.fetch_error.emit(api.state.last_error)
-
-            # Fetch secondary prices
-            if secondary:
-                prices = get_prices(secondary, vs_currency)
-                if prices:
-                    self.secondary_fetched.emit(prices)
-                elif api and api.state.last_error:
-                    self.fetch_error.emit(api.state.last_error)
+            elif api and api.state.last_error:
+                self.fetch_error.emit(api.state.last_error)
 
         except Exception as e:
             self.fetch_error.emit(str(e))
-
-
-class PriceFetchThread(QThread):
-    """Thread that runs price fetching."""
-
-    def __init__(self, worker: PriceWorker, parent=None):
-        super().__init__(parent)
-        self._worker = worker
-
-    def run(self):
-        """Run the fetch operation."""
-        self._worker.fetch()
+        finally:
+            self.fetch_finished.emit()
+
+    def _emit_prices(self, prices: Dict[str, float]):
+        """Emit prices_fetched unless the prices are the same as last time."""
+        if prices != self._last_prices:
+            self._last_prices = prices
+            self.prices_fetched.emit(prices)
@@ -1,13 +1,117 @@
 """Settings management for Crypto Ticker."""
 
+import functools
+import hashlib
 import json
+import logging
+import os
+import string
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass, asdict, field
-from typing import List
+from dataclasses import dataclass, fields
+from typing import Dict, Tuple
 
+if sys.platform == "win32":
+    import winreg as _winreg
+else:
+    _winreg = None
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # Optional: falls back to stdlib json
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+# Color settings stored as <prefix>_rgb (older versions: <prefix>_r/_g/_b)
+_COLOR_PREFIXES = ("text", "bg", "badge_bg", "badge_text", "indicator_up", "indicator_down")
+
+# Keys only found in settings files from older versions
+_LEGACY_KEYS = frozenset(
+    {"crypto_id", "transparent", "start_with_windows", "window_x", "window_y",
+     "secondary_font_scale"}
+    | {f"{prefix}_{channel}" for prefix in _COLOR_PREFIXES for channel in "rgb"}
+)
+
+# Old crypto_id setting -> symbol
+_ID_TO_SYMBOL = {
+    "bitcoin": "btc", "ethereum": "eth", "solana": "sol",
+    "cardano": "ada", "dogecoin": "doge", "ripple": "xrp",
+    "polkadot": "dot", "avalanche-2": "avax"
+}
+
+# macOS LaunchAgent and Linux autostart entries for launch on startup
+_PLIST_TEMPLATE = string.Template('''<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>Label</key>
+    <string>com.cryptoticker.app</string>
+    <key>ProgramArguments</key>
+    <array>
+        <string>$app_path</string>
+    </array>
+    <key>RunAtLoad</key>
+    <true/>
+</dict>
+</plist>''')
+
+_DESKTOP_TEMPLATE = string.Template('''[Desktop Entry]
+Type=Application
+Name=Crypto Ticker
+Exec=$app_path
+Hidden=false
+NoDisplay=false
+X-GNOME-Autostart-enabled=true
+''')
+
+# Settings file and launch-on-startup writes, off the UI thread and in order
+_SETTINGS_IO_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="settings-io")
+
+
+def _log_save_error(future: "Future[None]") -> None:
+    """Done callback for save_async(): report a failed write."""
+    error = future.exception()
+    if error is not None:
+        logger.warning("Error saving settings: %s", error)
+
+
+# Parsed settings by (path, st_mtime_ns, st_size); callers always get a copy
+_LOAD_CACHE: Dict[Tuple[str, int, int], "Settings"] = {}
+# load() runs on the UI thread, _forget_loaded() also on the settings I/O thread
+_LOAD_CACHE_LOCK = threading.RLock()
+
+
+def _forget_loaded(path: Path) -> None:
+    """Drop cached load() results for a settings file."""
+    with _LOAD_CACHE_LOCK:
+        for key in [key for key in _LOAD_CACHE if key[0] == str(path)]:
+            del _LOAD_CACHE[key]
+
+
+@functools.cache
+def _compute_app_path() -> str:
+    """Command that launches this app (sys.executable and __file__ never change)."""
+    if getattr(sys, 'frozen', False):
+        return sys.executable
+    else:
+        return f'"{sys.executable}" "{Path(__file__).parent / "main.py"}"'
+
+
+def _write_if_changed(path: Path, content: str) -> None:
+    """Write a text file (creating its directory) unless it already has this content."""
+    try:
+        if path.read_text() == content:
+            return
+    except (OSError, UnicodeDecodeError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@dataclass(slots=True)
 class Settings:
     """Application settings."""
 
@@ -16,49 +120,39 @@ class Settings:
     font_size: int = 24
     font_weight: int = 700
 
-    # Text color (RGBA)
-    text_r: int = 255
-    text_g: int = 255
-    text_b: int = 255
+    # Colors are packed 0xRRGGBB with a separate 0-100 opacity
+
+    # Text color
+    text_rgb: int = 0xFFFFFF
     text_alpha: int = 100  # 0-100
 
-    # Background color (RGBA)
-    bg_r: int = 0
-    bg_g: int = 0
-    bg_b: int = 0
+    # Background color
+    bg_rgb: int = 0x000000
     bg_alpha: int = 0  # 0-100 (0 = fully transparent)
 
     # Crypto settings
     crypto_symbol: str = "btc"  # Using symbol instead of id
     vs_currency: str = "usd"
     show_prefix: bool = True
-    secondary_cryptos: List[str] = field(default_factory=list)  # Additional symbols to track
+    secondary_cryptos: Tuple[str, ...] = ()  # Additional symbols to track (immutable)
     secondary_display: str = "hover"  # "hover" or "always"
-    secondary_font_scale: float = 0.7  # 0.1-3.0 multiplier of main font size
+    secondary_font_scale_pct: int = 70  # 10-300 (% of main font size)
 
     # Symbol badge settings (for popup)
     badge_font_name: str = "Segoe UI"  # Badge symbol font
     badge_font_weight: int = 400  # Badge text weight (100-900)
-    badge_bg_r: int = 255
-    badge_bg_g: int = 255
-    badge_bg_b: int = 255
+    badge_bg_rgb: int = 0xFFFFFF
     badge_bg_alpha: int = 100  # 0-100
 
-    badge_text_r: int = 0
-    badge_text_g: int = 0
-    badge_text_b: int = 0
+    badge_text_rgb: int = 0x000000
     badge_text_alpha: int = 100  # 0-100
 
     # Price change indicator settings
     indicator_enabled: bool = True
     indicator_flash_enabled: bool = True
-    indicator_up_r: int = 0
-    indicator_up_g: int = 255
-    indicator_up_b: int = 0
+    indicator_up_rgb: int = 0x00FF00
     indicator_up_alpha: int = 100  # 0-100
-    indicator_down_r: int = 255
-    indicator_down_g: int = 0
-    indicator_down_b: int = 0
+    indicator_down_rgb: int = 0xFF0000
     indicator_down_alpha: int = 100  # 0-100
 
     # Notification settings
@@ -84,161 +178,229 @@ class Settings:
     window_offset_x: int = 100
     window_offset_y: int = 100
 
+    # (digest, st_mtime_ns) of the last save() write (not a field: no annotation)
+    _last_saved = None
+
+    # Launch-on-startup state last applied to the OS in this process (not a field)
+    _startup_state = None
+
+    def __post_init__(self):
+        # Loaded JSON gives a list; tuple() of a tuple is a no-op
+        self.secondary_cryptos = tuple(self.secondary_cryptos)
+
     @staticmethod
+    @functools.cache
     def get_settings_path() -> Path:
-        """Get the path to the settings file."""
+        """Get the path to the settings file (resolved once per process)."""
         return Path.home() / "btcticker_settings.json"
 
     @staticmethod
+    @functools.cache
     def get_cache_dir() -> Path:
-        """Get the cache directory."""
+        """Get the cache directory (created once per process)."""
         cache_dir = Path.home() / ".btcticker_cache"
         cache_dir.mkdir(exist_ok=True)
         return cache_dir
 
     @classmethod
     def load(cls) -> "Settings":
-        """Load settings from file."""
+        """Load settings from file (re-parsed only when the file changed)."""
         path = cls.get_settings_path()
-        if path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return cls()
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        with _LOAD_CACHE_LOCK:
+            cached = _LOAD_CACHE.get(key)
+        if cached is not None:
+            return cached.copy()
+
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            return cls()  # Removed since the stat
+        try:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+            # Handle migration from old settings
+            if not _LEGACY_KEYS.isdisjoint(data):
+                cls._migrate(data)
+            # Filter out unknown fields
+            data = {k: data[k] for k in data.keys() & cls._VALID_FIELDS}
+            settings = cls(**data)
+        except (json.JSONDecodeError, TypeError, ValueError) as e:
+            logger.warning("Error loading settings: %s", e)
+            return cls()
+        with _LOAD_CACHE_LOCK:
+            _forget_loaded(path)
+            _LOAD_CACHE[key] = settings
+        return settings.copy()
+
+    @staticmethod
+    def _migrate(data: dict) -> None:
+        """Rewrite legacy keys in loaded settings data in place."""
+        if "crypto_id" in data:
+            # Map old id to symbol
+            data["crypto_symbol"] = _ID_TO_SYMBOL.get(data.pop("crypto_id"), "btc")
+        if "transparent" in data:
+            data.pop("transparent")  # Remove old field
+        if "start_with_windows" in data:
+            data["launch_on_startup"] = data.pop("start_with_windows")
+        # Migrate old window_x/window_y to corner-relative
+        if "window_x" in data or "window_y" in data:
+            # Keep as top_left with x/y as offsets
+            data["window_corner"] = "top_left"
+            data["window_offset_x"] = data.pop("window_x", 100)
+            data["window_offset_y"] = data.pop("window_y", 100)
+        if "secondary_font_scale" in data:
+            # Float multiplier -> integer percent
+            data["secondary_font_scale_pct"] = round(float(data.pop("secondary_font_scale")) * 100)
+        # Pack old per-channel colors, missing channels keep the default's value
+        for prefix in _COLOR_PREFIXES:
+            channels = [data.pop(f"{prefix}_{c}", None) for c in "rgb"]
+            if channels == [None, None, None]:
+                continue
+            key = f"{prefix}_rgb"
+            rgb = data.get(key, Settings.__dataclass_fields__[key].default)
+            for shift, value in zip((16, 8, 0), channels):
+                if value is not None:
+                    rgb = (rgb & ~(0xFF << shift)) | ((int(value) & 0xFF) << shift)
+            data[key] = rgb
+
+    def save(self, pretty: bool = False) -> None:
+        """Save settings to file (compact JSON unless pretty is set)."""
+        # Queued behind any pending save_async() so an older snapshot can't win
+        self._submit_write(pretty).result()
+
+    def save_async(self, pretty: bool = False) -> "Future[None]":
+        """Save settings on the settings I/O thread (the values are captured now)."""
+        future = self._submit_write(pretty)
+        future.add_done_callback(_log_save_error)
+        return future
+
+    def _submit_write(self, pretty: bool) -> "Future[None]":
+        """Queue a write of the current values on the settings I/O thread."""
+        return _SETTINGS_IO_EXECUTOR.submit(self._write, self.get_settings_path(), self._encode(pretty))
+
+    def _encode(self, pretty: bool) -> bytes:
+        """Serialize the settings to JSON bytes."""
+        data = self._as_plain_dict()
+        if orjson:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        if pretty:
+            return json.dumps(data, indent=2).encode("utf-8")
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def _write(path: Path, raw: bytes) -> None:
+        """Write encoded settings to path (runs on the settings I/O thread)."""
+        # Skip the write if these exact bytes were the last thing saved
+        # and the file hasn't been touched since
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        if Settings._last_saved is not None and Settings._last_saved[0] == digest:
             try:
-                with open(path, "r") as f:
-                    data = json.load(f)
-                # Handle migration from old settings
-                if "crypto_id" in data:
-                    # Map old id to symbol
-                    old_id = data.pop("crypto_id")
-                    id_to_symbol = {
-                        "bitcoin": "btc", "ethereum": "eth", "solana": "sol",
-                        "cardano": "ada", "dogecoin": "doge", "ripple": "xrp",
-                        "polkadot": "dot", "avalanche-2": "avax"
-                    }
-                    data["crypto_symbol"] = id_to_symbol.get(old_id, "btc")
-                if "transparent" in data:
-                    data.pop("transparent")  # Remove old field
-                if "start_with_windows" in data:
-                    data["launch_on_startup"] = data.pop("start_with_windows")
-                # Migrate old window_x/window_y to corner-relative
-                if "window_x" in data or "window_y" in data:
-                    # Keep as top_left with x/y as offsets
-                    data["window_corner"] = "top_left"
-                    data["window_offset_x"] = data.pop("window_x", 100)
-                    data["window_offset_y"] = data.pop("window_y", 100)
-                # Filter out unknown fields
-                valid_fields = set(cls.__dataclass_fields__.keys())
-                data = {k: v for k, v in data.items() if k in valid_fields}
-                return cls(**data)
-            except (json.JSONDecodeError, TypeError) as e:
-                print(f"Error loading settings: {e}")
-        return cls()
-
-    def save(self) -> None:
-        """Save settings to file."""
-        path = self.get_settings_path()
-        with open(path, "w") as f:
-            json.dump(asdict(self), f, indent=2)
+                if path.stat().st_mtime_ns == Settings._last_saved[1]:
+                    return
+            except OSError:
+                pass
+        _forget_loaded(path)
+        # Write a sibling file and swap it in, so the settings file is never half-written
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(raw)
+        os.replace(tmp_path, path)
+        Settings._last_saved = (digest, path.stat().st_mtime_ns)
+
+    def _as_plain_dict(self) -> dict:
+        """Field values as a dict (all values are immutable, so shallow is enough)."""
+        return {name: getattr(self, name) for name in self._FIELD_NAMES}
 
     def copy(self) -> "Settings":
         """Create a copy of settings."""
-        return Settings(**asdict(self))
+        return Settings(**self._as_plain_dict())
+
+    def set_launch_on_startup(self, enabled: bool) -> "Future[bool]":
+        """Configure launch on startup (cross-platform) on a background thread."""
+        # Already applied this session - don't touch the registry/files again
+        if enabled == Settings._startup_state:
+            done = Future()
+            done.set_result(True)
+            return done
+        return _SETTINGS_IO_EXECUTOR.submit(self._apply_launch_on_startup, enabled)
 
-    def set_launch_on_startup(self, enabled: bool) -> bool:
-        """Configure launch on startup (cross-platform)."""
+    def _apply_launch_on_startup(self, enabled: bool) -> bool:
+        """Write the OS launch-on-startup entry (blocking)."""
         if sys.platform == "win32":
-            return self._set_startup_windows(enabled)
+            ok = self._set_startup_windows(enabled)
         elif sys.platform == "darwin":
-            return self._set_startup_macos(enabled)
+            ok = self._set_startup_macos(enabled)
         else:  # Linux and others
-            return self._set_startup_linux(enabled)
+            ok = self._set_startup_linux(enabled)
+        if ok:
+            Settings._startup_state = enabled
+        return ok
 
     def _get_app_path(self) -> str:
         """Get the application path for startup."""
-        if getattr(sys, 'frozen', False):
-            return sys.executable
-        else:
-            return f'"{sys.executable}" "{Path(__file__).parent / "main.py"}"'
+        return _compute_app_path()
 
     def _set_startup_windows(self, enabled: bool) -> bool:
         """Configure Windows registry for launch on startup."""
         try:
-            import winreg
             app_path = self._get_app_path()
             key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
             app_name = "CryptoTicker"
 
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_SET_VALUE)
+            key = _winreg.OpenKey(_winreg.HKEY_CURRENT_USER, key_path, 0, _winreg.KEY_SET_VALUE)
             if enabled:
-                winreg.SetValueEx(key, app_name, 0, winreg.REG_SZ, app_path)
+                _winreg.SetValueEx(key, app_name, 0, _winreg.REG_SZ, app_path)
             else:
                 try:
-                    winreg.DeleteValue(key, app_name)
+                    _winreg.DeleteValue(key, app_name)
                 except FileNotFoundError:
                     pass
-            winreg.CloseKey(key)
+            _winreg.CloseKey(key)
             return True
         except Exception as e:
-            print(f"Windows startup error: {e}")
+            logger.warning("Windows startup error: %s", e)
             return False
 
     def _set_startup_macos(self, enabled: bool) -> bool:
         """Configure macOS LaunchAgent for launch on startup."""
         try:
             app_path = self._get_app_path()
-            plist_dir = Path.home() / "Library" / "LaunchAgents"
-            plist_path = plist_dir / "com.cryptoticker.app.plist"
+            plist_path = Path.home() / "Library" / "LaunchAgents" / "com.cryptoticker.app.plist"
 
             if enabled:
-                plist_dir.mkdir(parents=True, exist_ok=True)
-                plist_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>com.cryptoticker.app</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>{app_path}</string>
-    </array>
-    <key>RunAtLoad</key>
-    <true/>
-</dict>
-</plist>'''
-                plist_path.write_text(plist_content)
+                _write_if_changed(plist_path, _PLIST_TEMPLATE.substitute(app_path=app_path))
             else:
-                if plist_path.exists():
-                    plist_path.unlink()
+                plist_path.unlink(missing_ok=True)
             return True
         except Exception as e:
-            print(f"macOS startup error: {e}")
+            logger.warning("macOS startup error: %s", e)
             return False
 
     def _set_startup_linux(self, enabled: bool) -> bool:
         """Configure Linux autostart desktop file."""
         try:
             app_path = self._get_app_path()
-            autostart_dir = Path.home() / ".config" / "autostart"
-            desktop_path = autostart_dir / "cryptoticker.desktop"
+            desktop_path = Path.home() / ".config" / "autostart" / "cryptoticker.desktop"
 
             if enabled:
-                autostart_dir.mkdir(parents=True, exist_ok=True)
-                desktop_content = f'''[Desktop Entry]
-Type=Application
-Name=Crypto Ticker
-Exec={app_path}
-Hidden=false
-NoDisplay=false
-X-GNOME-Autostart-enabled=true
-'''
-                desktop_path.write_text(desktop_content)
+                _write_if_changed(desktop_path, _DESKTOP_TEMPLATE.substitute(app_path=app_path))
             else:
-                if desktop_path.exists():
-                    desktop_path.unlink()
+                desktop_path.unlink(missing_ok=True)
             return True
         except Exception as e:
-            print(f"Linux startup error: {e}")
+            logger.warning("Linux startup error: %s", e)
             return False
 
 
+# Field names in declaration order, and as a set for filtering the settings file
+Settings._FIELD_NAMES = tuple(f.name for f in fields(Settings))
+Settings._VALID_FIELDS = frozenset(Settings._FIELD_NAMES)
+
+
 # Font weight options
 FONT_WEIGHTS = {
     "Thin": 100,
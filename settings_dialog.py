@@ -1,40 +1,185 @@
 """Settings dialog for Crypto Ticker."""
 
+import json
+import re
+from contextlib import contextmanager
+from datetime import date
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QSpinBox, QDoubleSpinBox, QComboBox, QCheckBox, QPushButton,
     QGroupBox, QSlider, QColorDialog, QFontDialog, QFileDialog,
-    QWidget, QLineEdit, QCompleter, QScrollArea
+    QWidget, QLineEdit, QCompleter, QScrollArea, QTabWidget
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont, QColor, QFontDatabase
+from PySide6.QtCore import Qt, Signal, QSignalBlocker, QStringListModel, QThreadPool, QTimer
+from PySide6.QtGui import QFont, QColor, QFontDatabase, QPalette
+
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from settings import Settings, FONT_WEIGHTS
 from api import get_api
+from price_popup import qt_color
+
+
+# Symbol in a crypto combo entry ("BTC - Bitcoin" or typed "btc")
+_CRYPTO_SYM_RE = re.compile(r"\s*(\S+)")
+# Symbols in the comma-separated secondary list
+_SECONDARY_SYM_RE = re.compile(r"[^,\s]+")
+
+# Crypto combo entries built from the API coin list, reused until the date changes
+COIN_COMBO_CACHE_FILE = "coin_combo.json"
+
+# Weight combo entries and the reverse (weight value -> name) lookup
+_WEIGHT_NAMES = list(FONT_WEIGHTS)
+_WEIGHT_NAME_BY_VALUE = {value: name for name, value in FONT_WEIGHTS.items()}
+
+# System font families, enumerated once per process on first use
+_FAMILIES_CACHE: Optional[List[str]] = None
+
+
+def _get_families() -> List[str]:
+    """Get the system font families (cached)."""
+    global _FAMILIES_CACHE
+    if _FAMILIES_CACHE is None:
+        _FAMILIES_CACHE = QFontDatabase.families()
+    return _FAMILIES_CACHE
+
+
+def _add_combo_items(combo: QComboBox, items: Sequence[Tuple[str, str]]) -> Dict[str, int]:
+    """Add (text, data) items to a combo box in one batch, returning {data: row}."""
+    start = combo.count()
+    rows: Dict[str, int] = {}
+    was_blocked = combo.blockSignals(True)
+    combo.addItems([text for text, _ in items])
+    model = combo.model()
+    for row, (_, data) in enumerate(items, start):
+        model.setData(model.index(row, 0), data, Qt.UserRole)
+        rows.setdefault(data, row)
+    combo.blockSignals(was_blocked)
+    return rows
+
+
+def _read_coin_combo_cache() -> Optional[List[Tuple[str, str]]]:
+    """Crypto combo entries cached today, or None."""
+    path = Settings.get_cache_dir() / COIN_COMBO_CACHE_FILE
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("date") != date.today().isoformat():
+        return None
+    return [(text, sym) for text, sym in data.get("items", [])]
+
+
+def _write_coin_combo_cache(items: List[Tuple[str, str]]):
+    """Cache crypto combo entries for the rest of the day."""
+    path = Settings.get_cache_dir() / COIN_COMBO_CACHE_FILE
+    data = {"date": date.today().isoformat(), "items": items}
+    try:
+        path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+    except OSError:
+        pass
+
+
+class _FamilyIndex:
+    """Case-insensitive substring search over font families via a bigram index."""
+
+    def __init__(self, families: List[str]):
+        self._families = families
+        self._rows = {name: row for row, name in enumerate(families)}
+        self._lower = [name.lower() for name in families]
+        self._bigrams: Dict[str, List[int]] = {}
+        for row, name in enumerate(self._lower):
+            for bigram in {name[i:i + 2] for i in range(len(name) - 1)}:
+                self._bigrams.setdefault(bigram, []).append(row)
+
+    def find(self, family: str) -> int:
+        """Row of an exact family name, or -1."""
+        return self._rows.get(family, -1)
+
+    def search(self, text: str) -> List[str]:
+        """Families containing text, in list order."""
+        pattern = text.lower()
+        if len(pattern) < 2:
+            return [f for f, name in zip(self._families, self._lower) if pattern in name]
+
+        # Rows containing every bigram of the pattern, smallest posting list first
+        postings = sorted(
+            (self._bigrams.get(pattern[i:i + 2], ()) for i in range(len(pattern) - 1)),
+            key=len
+        )
+        candidates = set(postings[0])
+        for rows in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(rows)
+
+        # Bigrams can match out of order - confirm on the (small) candidate set
+        return [
+            self._families[row] for row in sorted(candidates)
+            if pattern in self._lower[row]
+        ]
 
 
 class SearchableFontComboBox(QComboBox):
-    """Font combo box with search/filter capability."""
+    """Font combo box with search/filter capability (fonts are listed on first use)."""
+
+    # One family list model and search index shared by every instance
+    _shared_model: Optional[QStringListModel] = None
+    _shared_index: Optional[_FamilyIndex] = None
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setEditable(True)
         self.setInsertPolicy(QComboBox.NoInsert)
+        self._populated = False
+
+    def _ensure_populated(self):
+        """Fill the list and completer the first time the combo is opened or focused."""
+        if self._populated:
+            return
+        self._populated = True
+        cls = type(self)
+        if cls._shared_model is None:
+            cls._shared_model = QStringListModel(_get_families())
+            cls._shared_index = _FamilyIndex(_get_families())
+
+        # Setting a model would select the first font - keep the current text instead
+        text = self.currentText()
+        self.blockSignals(True)
+        self.setModel(cls._shared_model)
+        idx = cls._shared_index.find(text)
+        if idx >= 0:
+            self.setCurrentIndex(idx)
+        else:
+            self.setEditText(text)
+        self.blockSignals(False)
+
+        # Setup completer for search: matches come from the index, not a scan by QCompleter
+        self._matches = QStringListModel(self)
+        completer = QCompleter(self)
+        completer.setModel(self._matches)
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.setCompleter(completer)
+        self.lineEdit().textEdited.connect(self._update_matches)
 
-        # Get all system fonts
-        font_db = QFontDatabase()
-        families = font_db.families()
-        self.addItems(families)
+    def _update_matches(self, text: str):
+        """Refresh completer matches (runs before the line edit opens the popup)."""
+        self._matches.setStringList(self._shared_index.search(text))
 
-        # Setup completer for search
-        completer = QCompleter(families, self)
-        completer.setCaseSensitivity(Qt.CaseInsensitive)
-        completer.setFilterMode(Qt.MatchContains)
-        self.setCompleter(completer)
+    def showPopup(self):
+        """Populate before showing the list."""
+        self._ensure_populated()
+        super().showPopup()
+
+    def focusInEvent(self, event):
+        """Populate before the user can type a search."""
+        self._ensure_populated()
+        super().focusInEvent(event)
 
     def setCurrentFont(self, font: QFont):
         """Set current font by QFont object."""
-        idx = self.findText(font.family())
+        idx = self._shared_index.find(font.family()) if self._populated else -1
         if idx >= 0:
             self.setCurrentIndex(idx)
         else:
@@ -45,22 +190,43 @@ class SearchableFontComboBox(QComboBox):
         return QFont(self.currentText())
 
 
+# Combo options shown before (or without) the API's lists
+DEFAULT_SYMBOLS = ("btc", "eth", "sol", "ada", "doge", "xrp", "dot", "avax")
+DEFAULT_CURRENCIES = ("usd", "eur", "gbp", "jpy", "cad", "aud", "chf", "cny")
+_DEFAULT_SYMBOL_ITEMS = tuple((sym.upper(), sym) for sym in DEFAULT_SYMBOLS)
+_DEFAULT_CURRENCY_ITEMS = tuple((curr.upper(), curr) for curr in DEFAULT_CURRENCIES)
+
+# Delay before a live-preview update is emitted (about one frame)
+EMIT_DEBOUNCE_MS = 16
+
+
 class SettingsDialog(QDialog):
     """Settings dialog with live preview."""
 
+    # Carries the dialog's own Settings (no copy per emit): receivers copy the values they keep
     settings_changed = Signal(Settings)
+    # API lists fetched on the thread pool, delivered (queued) on the UI thread
+    _coin_list_loaded = Signal(list)
+    _currencies_loaded = Signal(list)
 
     def __init__(self, settings: Settings, parent=None):
         super().__init__(parent)
         self._original_settings = settings.copy()
         self._settings = settings.copy()
-        self._updating_ui = False
+        # Coalesces bursts of edits (typing, slider drags) into one live-preview update
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(EMIT_DEBOUNCE_MS)
+        self._emit_timer.timeout.connect(self._flush_changes)
+        self._previewed = False  # A live-preview update has been emitted
+
+        self._coin_list_loaded.connect(self._on_coin_list_loaded)
+        self._currencies_loaded.connect(self._on_currencies_loaded)
 
         self.setWindowTitle("Crypto Ticker Settings")
         self.setMinimumWidth(480)
 
         self._setup_ui()
-        self._load_settings()
 
     def _setup_ui(self):
         """Set up the dialog UI with compact layout."""
@@ -68,17 +234,66 @@ class SettingsDialog(QDialog):
         main_layout.setSpacing(8)
         main_layout.setContentsMargins(10, 10, 10, 10)
 
-        main_layout.addWidget(self._create_font_group())
-        main_layout.addWidget(self._create_color_group())
-        main_layout.addWidget(self._create_crypto_group())
-        main_layout.addWidget(self._create_secondary_group())
-        main_layout.addWidget(self._create_indicator_group())
-        main_layout.addWidget(self._create_notification_group())
-        main_layout.addWidget(self._create_api_group())
-        main_layout.addWidget(self._create_system_group())
-        main_layout.addStretch()
+        # Tab pages are built on first visit: (title, ((group builder, settings loader), ...))
+        self._pages = (
+            ("Display", (
+                (self._create_font_group, self._load_font_settings),
+                (self._create_color_group, self._load_color_settings),
+            )),
+            ("Prices", (
+                (self._create_crypto_group, self._load_crypto_settings),
+                (self._create_secondary_group, self._load_secondary_settings),
+            )),
+            ("Alerts", (
+                (self._create_indicator_group, self._load_indicator_settings),
+                (self._create_notification_group, self._load_notification_settings),
+            )),
+            ("System", (
+                (self._create_api_group, self._load_api_settings),
+                (self._create_system_group, self._load_system_settings),
+            )),
+        )
+        self._built_pages = set()
+        # Color rows by settings prefix: (swatch button, opacity slider, percentage label or None)
+        self._color_rows: Dict[str, Tuple[QPushButton, QSlider, Optional[QLabel]]] = {}
+        self._swatch_rgb: Dict[QPushButton, int] = {}  # Color last applied to each swatch
+
+        # Picker dialogs, created on first use and reused afterwards
+        self._color_dialog: Optional[QColorDialog] = None
+        self._font_dialog: Optional[QFontDialog] = None
+        self._sound_dialog: Optional[QFileDialog] = None
+
+        # Enabled state last applied to the notification controls (None: not yet)
+        self._notification_controls_enabled: Optional[bool] = None
+
+        self._tabs = QTabWidget()
+        for title, _ in self._pages:
+            self._tabs.addTab(QWidget(), title)
+        self._tabs.currentChanged.connect(self._ensure_page)
+        self._ensure_page(self._tabs.currentIndex())
+
+        main_layout.addWidget(self._tabs)
         main_layout.addWidget(self._create_buttons())
 
+    def _ensure_page(self, index: int):
+        """Build a tab's groups and load their settings the first time it is shown."""
+        if index < 0 or index in self._built_pages:
+            return
+        self._built_pages.add(index)
+
+        _, sections = self._pages[index]
+        layout = QVBoxLayout(self._tabs.widget(index))
+        for create_group, _ in sections:
+            layout.addWidget(create_group())
+        layout.addStretch()
+
+        # Loading must not echo back through the change handlers
+        blockers = [QSignalBlocker(w) for w in self._tabs.widget(index).findChildren(QWidget)]
+        for _, load_settings in sections:
+            load_settings()
+        for blocker in blockers:
+            blocker.unblock()
+
     def _create_font_group(self) -> QGroupBox:
         """Create font settings group."""
         group = QGroupBox("Font")
@@ -106,8 +321,7 @@ class SettingsDialog(QDialog):
 
         layout.addWidget(QLabel("Weight:"), 1, 2)
         self._font_weight = QComboBox()
-        for name in FONT_WEIGHTS.keys():
-            self._font_weight.addItem(name)
+        self._font_weight.addItems(_WEIGHT_NAMES)
         self._font_weight.currentTextChanged.connect(self._on_font_weight_changed)
         layout.addWidget(self._font_weight, 1, 3, 1, 2)
 
@@ -119,32 +333,10 @@ class SettingsDialog(QDialog):
         layout = QGridLayout(group)
 
         layout.addWidget(QLabel("Text Color:"), 0, 0)
-        self._text_color_btn = QPushButton()
-        self._text_color_btn.setFixedSize(60, 25)
-        self._text_color_btn.clicked.connect(self._pick_text_color)
-        layout.addWidget(self._text_color_btn, 0, 1)
-
-        layout.addWidget(QLabel("Opacity:"), 0, 2)
-        self._text_alpha = QSlider(Qt.Horizontal)
-        self._text_alpha.setRange(0, 100)
-        self._text_alpha.valueChanged.connect(self._on_text_alpha_changed)
-        layout.addWidget(self._text_alpha, 0, 3)
-        self._text_alpha_label = QLabel("100%")
-        layout.addWidget(self._text_alpha_label, 0, 4)
+        layout.addLayout(self._make_color_row("text", "Text Color", (60, 25), show_percent=True), 0, 1)
 
         layout.addWidget(QLabel("Background:"), 1, 0)
-        self._bg_color_btn = QPushButton()
-        self._bg_color_btn.setFixedSize(60, 25)
-        self._bg_color_btn.clicked.connect(self._pick_bg_color)
-        layout.addWidget(self._bg_color_btn, 1, 1)
-
-        layout.addWidget(QLabel("Opacity:"), 1, 2)
-        self._bg_alpha = QSlider(Qt.Horizontal)
-        self._bg_alpha.setRange(0, 100)
-        self._bg_alpha.valueChanged.connect(self._on_bg_alpha_changed)
-        layout.addWidget(self._bg_alpha, 1, 3)
-        self._bg_alpha_label = QLabel("0%")
-        layout.addWidget(self._bg_alpha_label, 1, 4)
+        layout.addLayout(self._make_color_row("bg", "Background Color", (60, 25), show_percent=True), 1, 1)
 
         return group
 
@@ -218,37 +410,16 @@ class SettingsDialog(QDialog):
 
         layout.addWidget(QLabel("Weight:"), 2, 2)
         self._badge_font_weight = QComboBox()
-        for name in FONT_WEIGHTS.keys():
-            self._badge_font_weight.addItem(name)
+        self._badge_font_weight.addItems(_WEIGHT_NAMES)
         self._badge_font_weight.currentTextChanged.connect(self._on_badge_font_weight_changed)
         layout.addWidget(self._badge_font_weight, 2, 3)
 
         # Row 3: Badge colors (background and text on same row)
         layout.addWidget(QLabel("Badge BG:"), 3, 0)
-        badge_bg_layout = QHBoxLayout()
-        badge_bg_layout.setContentsMargins(0, 0, 0, 0)
-        self._badge_bg_btn = QPushButton()
-        self._badge_bg_btn.setFixedSize(40, 20)
-        self._badge_bg_btn.clicked.connect(self._pick_badge_bg_color)
-        badge_bg_layout.addWidget(self._badge_bg_btn)
-        self._badge_bg_alpha = QSlider(Qt.Horizontal)
-        self._badge_bg_alpha.setRange(0, 100)
-        self._badge_bg_alpha.valueChanged.connect(self._on_badge_bg_alpha_changed)
-        badge_bg_layout.addWidget(self._badge_bg_alpha)
-        layout.addLayout(badge_bg_layout, 3, 1)
+        layout.addLayout(self._make_color_row("badge_bg", "Badge Background"), 3, 1)
 
         layout.addWidget(QLabel("Badge Text:"), 3, 2)
-        badge_text_layout = QHBoxLayout()
-        badge_text_layout.setContentsMargins(0, 0, 0, 0)
-        self._badge_text_btn = QPushButton()
-        self._badge_text_btn.setFixedSize(40, 20)
-        self._badge_text_btn.clicked.connect(self._pick_badge_text_color)
-        badge_text_layout.addWidget(self._badge_text_btn)
-        self._badge_text_alpha = QSlider(Qt.Horizontal)
-        self._badge_text_alpha.setRange(0, 100)
-        self._badge_text_alpha.valueChanged.connect(self._on_badge_text_alpha_changed)
-        badge_text_layout.addWidget(self._badge_text_alpha)
-        layout.addLayout(badge_text_layout, 3, 3)
+        layout.addLayout(self._make_color_row("badge_text", "Badge Text Color"), 3, 3)
 
         return group
 
@@ -270,30 +441,10 @@ class SettingsDialog(QDialog):
 
         # Row 1: Up color and Down color
         layout.addWidget(QLabel("Up Color:"), 1, 0)
-        up_layout = QHBoxLayout()
-        up_layout.setContentsMargins(0, 0, 0, 0)
-        self._indicator_up_btn = QPushButton()
-        self._indicator_up_btn.setFixedSize(40, 20)
-        self._indicator_up_btn.clicked.connect(self._pick_indicator_up_color)
-        up_layout.addWidget(self._indicator_up_btn)
-        self._indicator_up_alpha = QSlider(Qt.Horizontal)
-        self._indicator_up_alpha.setRange(0, 100)
-        self._indicator_up_alpha.valueChanged.connect(self._on_indicator_up_alpha_changed)
-        up_layout.addWidget(self._indicator_up_alpha)
-        layout.addLayout(up_layout, 1, 1)
+        layout.addLayout(self._make_color_row("indicator_up", "Up Color"), 1, 1)
 
         layout.addWidget(QLabel("Down Color:"), 1, 2)
-        down_layout = QHBoxLayout()
-        down_layout.setContentsMargins(0, 0, 0, 0)
-        self._indicator_down_btn = QPushButton()
-        self._indicator_down_btn.setFixedSize(40, 20)
-        self._indicator_down_btn.clicked.connect(self._pick_indicator_down_color)
-        down_layout.addWidget(self._indicator_down_btn)
-        self._indicator_down_alpha = QSlider(Qt.Horizontal)
-        self._indicator_down_alpha.setRange(0, 100)
-        self._indicator_down_alpha.valueChanged.connect(self._on_indicator_down_alpha_changed)
-        down_layout.addWidget(self._indicator_down_alpha)
-        layout.addLayout(down_layout, 1, 3)
+        layout.addLayout(self._make_color_row("indicator_down", "Down Color"), 1, 3)
 
         return group
 
@@ -421,128 +572,131 @@ class SettingsDialog(QDialog):
         return widget
 
     def _load_crypto_options(self):
-        """Load crypto options from API or defaults."""
+        """Load default crypto options now and the API's coin list in the background."""
+        # Top coins first, so the combo is usable before the API answers
+        self._crypto_rows = _add_combo_items(self._crypto_combo, _DEFAULT_SYMBOL_ITEMS)
+        cached = _read_coin_combo_cache()
+        if cached is not None:
+            self._add_coin_items(cached)
+            return
         api = get_api()
-        default_symbols = ["btc", "eth", "sol", "ada", "doge", "xrp", "dot", "avax"]
-
         if api:
-            coin_list = api.get_coin_list()
-            # Add top coins first
-            for sym in default_symbols:
-                self._crypto_combo.addItem(sym.upper(), sym)
-            # Add some popular others
-            added = set(default_symbols)
-            for coin in coin_list[:100]:
-                sym = coin.get("symbol", "").lower()
-                if sym and sym not in added:
-                    self._crypto_combo.addItem(f"{sym.upper()} - {coin.get('name', '')}", sym)
-                    added.add(sym)
-        else:
-            for sym in default_symbols:
-                self._crypto_combo.addItem(sym.upper(), sym)
+            self._fetch_in_background(api.get_coin_list, self._coin_list_loaded)
 
     def _load_currency_options(self):
-        """Load currency options from API or defaults."""
+        """Load default currency options now and the API's currencies in the background."""
+        self._currency_rows = _add_combo_items(self._currency_combo, _DEFAULT_CURRENCY_ITEMS)
         api = get_api()
-        default_currencies = ["usd", "eur", "gbp", "jpy", "cad", "aud", "chf", "cny"]
-
         if api:
-            currencies = api.get_supported_currencies()
-            for curr in currencies:
-                self._currency_combo.addItem(curr.upper(), curr)
-        else:
-            for curr in default_currencies:
-                self._currency_combo.addItem(curr.upper(), curr)
+            self._fetch_in_background(api.get_supported_currencies, self._currencies_loaded)
+
+    @staticmethod
+    def _fetch_in_background(fetch, loaded):
+        """Run a blocking API call on the global thread pool and emit its result."""
+        def run():
+            result = fetch()
+            try:
+                loaded.emit(result)
+            except RuntimeError:
+                pass  # Dialog was deleted before the call returned
+        QThreadPool.globalInstance().start(run)
+
+    def _on_coin_list_loaded(self, coin_list: list):
+        """Append popular coins from the API after the defaults."""
+        items = []
+        added = set(self._crypto_rows)
+        for coin in coin_list[:100]:
+            sym = coin.get("symbol", "").lower()
+            if sym and sym not in added:
+                items.append((f"{sym.upper()} - {coin.get('name', '')}", sym))
+                added.add(sym)
+        # An empty list means the API fell back to its built-in coins - don't cache that
+        if items:
+            _write_coin_combo_cache(items)
+        self._add_coin_items(items)
+
+    def _add_coin_items(self, items: List[Tuple[str, str]]):
+        """Append coin entries after the defaults."""
+        self._crypto_rows.update(_add_combo_items(self._crypto_combo, items))
+
+        # Select the configured coin if it only just arrived and is still what the combo shows
+        sym = self._settings.crypto_symbol
+        idx = self._crypto_rows.get(sym, -1)
+        combo = self._crypto_combo
+        if idx >= 0 and combo.currentData() != sym and combo.currentText().lower() == sym:
+            blocker = QSignalBlocker(self._crypto_combo)
+            self._crypto_combo.setCurrentIndex(idx)
+            blocker.unblock()
 
-    def _load_settings(self):
-        """Load settings into UI controls."""
-        self._updating_ui = True
+    def _on_currencies_loaded(self, currencies: list):
+        """Append the API's supported currencies after the defaults."""
+        items = [(curr.upper(), curr) for curr in currencies if curr not in self._currency_rows]
+        self._currency_rows.update(_add_combo_items(self._currency_combo, items))
 
-        # Font
+        idx = self._currency_rows.get(self._settings.vs_currency, -1)
+        if idx >= 0 and self._currency_combo.currentData() != self._settings.vs_currency:
+            blocker = QSignalBlocker(self._currency_combo)
+            self._currency_combo.setCurrentIndex(idx)
+            blocker.unblock()
+
+    def _load_font_settings(self):
+        """Load font settings into UI controls."""
         self._font_combo.setCurrentFont(QFont(self._settings.font_name))
         self._font_size.setValue(self._settings.font_size)
 
-        weight_name = "Bold"
-        for name, value in FONT_WEIGHTS.items():
-            if value == self._settings.font_weight:
-                weight_name = name
-                break
-        self._font_weight.setCurrentText(weight_name)
-
-        # Colors
-        self._update_color_button(
-            self._text_color_btn,
-            QColor(self._settings.text_r, self._settings.text_g, self._settings.text_b)
+        self._font_weight.setCurrentText(
+            _WEIGHT_NAME_BY_VALUE.get(self._settings.font_weight, "Bold")
         )
-        self._text_alpha.setValue(self._settings.text_alpha)
-        self._text_alpha_label.setText(f"{self._settings.text_alpha}%")
 
-        self._update_color_button(
-            self._bg_color_btn,
-            QColor(self._settings.bg_r, self._settings.bg_g, self._settings.bg_b)
-        )
-        self._bg_alpha.setValue(self._settings.bg_alpha)
-        self._bg_alpha_label.setText(f"{self._settings.bg_alpha}%")
+    def _load_color_settings(self):
+        """Load text and background colors into UI controls."""
+        self._load_color_row("text")
+        self._load_color_row("bg")
 
-        # Crypto
-        idx = self._crypto_combo.findData(self._settings.crypto_symbol)
+    def _load_crypto_settings(self):
+        """Load main crypto settings into UI controls."""
+        idx = self._crypto_rows.get(self._settings.crypto_symbol, -1)
         if idx >= 0:
             self._crypto_combo.setCurrentIndex(idx)
         else:
             self._crypto_combo.setEditText(self._settings.crypto_symbol.upper())
 
-        idx = self._currency_combo.findData(self._settings.vs_currency)
+        idx = self._currency_rows.get(self._settings.vs_currency, -1)
         if idx >= 0:
             self._currency_combo.setCurrentIndex(idx)
 
         self._show_prefix.setChecked(self._settings.show_prefix)
+
+    def _load_secondary_settings(self):
+        """Load secondary prices and badge settings into UI controls."""
         self._secondary_cryptos.setText(",".join(self._settings.secondary_cryptos))
 
         idx = self._secondary_display.findData(self._settings.secondary_display)
         if idx >= 0:
             self._secondary_display.setCurrentIndex(idx)
 
-        scale_int = int(self._settings.secondary_font_scale * 100)
-        self._secondary_font_scale.setValue(scale_int)
-        self._secondary_font_scale_label.setText(f"{self._settings.secondary_font_scale:.1f}x")
+        self._secondary_font_scale.setValue(self._settings.secondary_font_scale_pct)
+        self._secondary_font_scale_label.setText(f"{self._settings.secondary_font_scale_pct / 100:.1f}x")
 
         # Badge font, weight, and colors
         self._badge_font_combo.setCurrentFont(QFont(self._settings.badge_font_name))
 
-        badge_weight_name = "Regular"
-        for name, value in FONT_WEIGHTS.items():
-            if value == self._settings.badge_font_weight:
-                badge_weight_name = name
-                break
-        self._badge_font_weight.setCurrentText(badge_weight_name)
-
-        self._update_color_button(
-            self._badge_bg_btn,
-            QColor(self._settings.badge_bg_r, self._settings.badge_bg_g, self._settings.badge_bg_b)
+        self._badge_font_weight.setCurrentText(
+            _WEIGHT_NAME_BY_VALUE.get(self._settings.badge_font_weight, "Regular")
         )
-        self._badge_bg_alpha.setValue(self._settings.badge_bg_alpha)
 
-        self._update_color_button(
-            self._badge_text_btn,
-            QColor(self._settings.badge_text_r, self._settings.badge_text_g, self._settings.badge_text_b)
-        )
-        self._badge_text_alpha.setValue(self._settings.badge_text_alpha)
+        self._load_color_row("badge_bg")
+        self._load_color_row("badge_text")
 
-        # Indicator
+    def _load_indicator_settings(self):
+        """Load price change indicator settings into UI controls."""
         self._indicator_enabled.setChecked(self._settings.indicator_enabled)
         self._indicator_flash_enabled.setChecked(self._settings.indicator_flash_enabled)
-        self._update_color_button(
-            self._indicator_up_btn,
-            QColor(self._settings.indicator_up_r, self._settings.indicator_up_g, self._settings.indicator_up_b)
-        )
-        self._indicator_up_alpha.setValue(self._settings.indicator_up_alpha)
-        self._update_color_button(
-            self._indicator_down_btn,
-            QColor(self._settings.indicator_down_r, self._settings.indicator_down_g, self._settings.indicator_down_b)
-        )
-        self._indicator_down_alpha.setValue(self._settings.indicator_down_alpha)
+        self._load_color_row("indicator_up")
+        self._load_color_row("indicator_down")
 
-        # Notifications
+    def _load_notification_settings(self):
+        """Load notification settings into UI controls."""
         self._notifications_enabled.setChecked(self._settings.notifications_enabled)
         self._notification_threshold.setValue(self._settings.notification_threshold)
         idx = self._notification_direction.findData(self._settings.notification_direction)
@@ -552,291 +706,278 @@ class SettingsDialog(QDialog):
         self._notification_sound.setText(self._settings.notification_sound)
         self._update_notification_controls_state()
 
-        # API
+    def _load_api_settings(self):
+        """Load API settings into UI controls."""
         self._update_interval.setValue(self._settings.update_interval)
         self._retry_attempts.setValue(self._settings.retry_attempts)
         self._retry_wait.setValue(self._settings.retry_wait)
 
-        # System
+    def _load_system_settings(self):
+        """Load system settings into UI controls."""
         self._always_on_top.setChecked(self._settings.always_on_top)
         self._launch_on_startup.setChecked(self._settings.launch_on_startup)
 
-        self._updating_ui = False
+    def _make_color_row(self, prefix: str, title: str, size: Tuple[int, int] = (40, 20),
+                        show_percent: bool = False) -> QHBoxLayout:
+        """Build a swatch button and opacity slider for the <prefix>_rgb/_alpha settings."""
+        layout = QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        button = self._create_color_button(*size)
+        button.clicked.connect(lambda: self._pick_color(prefix, title))
+        layout.addWidget(button)
+
+        slider = QSlider(Qt.Horizontal)
+        slider.setRange(0, 100)
+        slider.valueChanged.connect(lambda value: self._set_alpha(prefix, value))
+        layout.addWidget(slider)
+
+        percent = None
+        if show_percent:
+            percent = QLabel()
+            percent.setFixedWidth(32)
+            layout.addWidget(percent)
+
+        self._color_rows[prefix] = (button, slider, percent)
+        return layout
+
+    def _load_color_row(self, prefix: str):
+        """Load one color row's swatch, slider and percentage from settings."""
+        button, slider, percent = self._color_rows[prefix]
+        self._update_color_button(button, self._settings_color(prefix))
+        alpha = getattr(self._settings, f"{prefix}_alpha")
+        slider.setValue(alpha)
+        if percent is not None:
+            percent.setText(f"{alpha}%")
+
+    def _settings_color(self, prefix: str) -> QColor:
+        """Current <prefix> color from settings (opaque)."""
+        return qt_color(getattr(self._settings, f"{prefix}_rgb"), 100)
+
+    def _create_color_button(self, width: int, height: int) -> QPushButton:
+        """Create a swatch button whose color comes from its palette."""
+        button = QPushButton()
+        button.setFixedSize(width, height)
+        # Flat + auto-fill so the palette color shows on every style, without stylesheets
+        button.setFlat(True)
+        button.setAutoFillBackground(True)
+        return button
 
     def _update_color_button(self, button: QPushButton, color: QColor):
-        """Update a color button's background."""
-        button.setStyleSheet(
-            f"background-color: rgb({color.red()}, {color.green()}, {color.blue()});"
-        )
+        """Update a color button's background (skipped when the color is unchanged)."""
+        rgb = color.rgb()
+        if self._swatch_rgb.get(button) == rgb:
+            return
+        self._swatch_rgb[button] = rgb
+        pal = button.palette()
+        pal.setColor(QPalette.Button, color)
+        button.setPalette(pal)
 
     def _emit_changes(self):
-        """Emit settings changed signal for live preview."""
-        if not self._updating_ui:
-            self.settings_changed.emit(self._settings.copy())
+        """Schedule a settings changed signal for live preview."""
+        self._emit_timer.start()
+
+    @contextmanager
+    def _batch(self, *widgets: QWidget):
+        """Set several controls at once: their handlers stay quiet and one update follows."""
+        blockers = [QSignalBlocker(w) for w in widgets]
+        try:
+            yield
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+        self._emit_changes()
+
+    def _flush_changes(self):
+        """Emit settings changed signal with the latest edits."""
+        self._previewed = True
+        self.settings_changed.emit(self._settings)
 
     # Individual change handlers
+    def _pick_color(self, prefix: str, title: str):
+        """Open color picker for one color row."""
+        dialog = self._get_color_dialog()
+        dialog.setWindowTitle(f"Select {title}")
+        dialog.setCurrentColor(self._settings_color(prefix))
+        if dialog.exec():
+            color = dialog.selectedColor()
+            setattr(self._settings, f"{prefix}_rgb", color.rgb() & 0xFFFFFF)
+            self._update_color_button(self._color_rows[prefix][0], color)
+            self._emit_changes()
+
+    def _get_color_dialog(self) -> QColorDialog:
+        """Color dialog shared by all color rows (created on first use)."""
+        if self._color_dialog is None:
+            self._color_dialog = QColorDialog(self)
+        return self._color_dialog
+
+    def _set_alpha(self, prefix: str, value: int):
+        """Store one color row's opacity."""
+        setattr(self._settings, f"{prefix}_alpha", value)
+        percent = self._color_rows[prefix][2]
+        if percent is not None:
+            percent.setText(f"{value}%")
+        self._emit_changes()
+
     def _on_font_changed(self, font_name: str):
-        if not self._updating_ui:
-            self._settings.font_name = font_name
-            self._emit_changes()
+        self._settings.font_name = font_name
+        self._emit_changes()
 
     def _on_font_size_changed(self, value: int):
-        if not self._updating_ui:
-            self._settings.font_size = value
-            self._emit_changes()
+        self._settings.font_size = value
+        self._emit_changes()
 
     def _on_font_weight_changed(self, name: str):
-        if not self._updating_ui:
-            self._settings.font_weight = FONT_WEIGHTS.get(name, 700)
-            self._emit_changes()
-
-    def _on_text_alpha_changed(self, value: int):
-        if not self._updating_ui:
-            self._settings.text_alpha = value
-            self._text_alpha_label.setText(f"{value}%")
-            self._emit_changes()
-
-    def _on_bg_alpha_changed(self, value: int):
-        if not self._updating_ui:
-            self._settings.bg_alpha = value
-            self._bg_alpha_label.setText(f"{value}%")
-            self._emit_changes()
+        self._settings.font_weight = FONT_WEIGHTS.get(name, 700)
+        self._emit_changes()
 
     def _on_crypto_changed(self, text: str):
-        if not self._updating_ui:
-            # Extract symbol from "SYM - Name" format or use as-is
-            sym = text.split(" - ")[0].strip().lower() if " - " in text else text.lower()
-            self._settings.crypto_symbol = sym
-            self._emit_changes()
+        # Extract symbol from "SYM - Name" format or use as-is
+        m = _CRYPTO_SYM_RE.match(text)
+        self._settings.crypto_symbol = (m.group(1) if m else text).lower()
+        self._emit_changes()
 
     def _on_currency_changed(self, text: str):
-        if not self._updating_ui:
-            self._settings.vs_currency = text.lower()
-            self._emit_changes()
+        self._settings.vs_currency = text.lower()
+        self._emit_changes()
 
     def _on_show_prefix_changed(self, state):
-        if not self._updating_ui:
-            self._settings.show_prefix = self._show_prefix.isChecked()
-            self._emit_changes()
+        self._settings.show_prefix = self._show_prefix.isChecked()
+        self._emit_changes()
 
     def _on_secondary_changed(self, text: str):
-        if not self._updating_ui:
-            symbols = [s.strip().lower() for s in text.split(",") if s.strip()]
-            self._settings.secondary_cryptos = symbols
-            self._emit_changes()
+        self._settings.secondary_cryptos = tuple(_SECONDARY_SYM_RE.findall(text.lower()))
+        self._emit_changes()
 
     def _on_secondary_display_changed(self, index: int):
-        if not self._updating_ui:
-            self._settings.secondary_display = self._secondary_display.currentData()
-            self._emit_changes()
+        self._settings.secondary_display = self._secondary_display.currentData()
+        self._emit_changes()
 
     def _on_secondary_font_scale_changed(self, value: int):
-        if not self._updating_ui:
-            scale = value / 100.0  # Convert to 0.1-3.0 range
-            self._settings.secondary_font_scale = scale
-            self._secondary_font_scale_label.setText(f"{scale:.1f}x")
-            self._emit_changes()
+        self._settings.secondary_font_scale_pct = value
+        self._secondary_font_scale_label.setText(f"{value / 100:.1f}x")
+        self._emit_changes()
 
     def _on_badge_font_changed(self, font_name: str):
-        if not self._updating_ui:
-            self._settings.badge_font_name = font_name
-            self._emit_changes()
+        self._settings.badge_font_name = font_name
+        self._emit_changes()
 
     def _on_badge_font_weight_changed(self, name: str):
-        if not self._updating_ui:
-            self._settings.badge_font_weight = FONT_WEIGHTS.get(name, 400)
-            self._emit_changes()
-
-    def _on_badge_bg_alpha_changed(self, value: int):
-        if not self._updating_ui:
-            self._settings.badge_bg_alpha = value
-            self._emit_changes()
-
-    def _on_badge_text_alpha_changed(self, value: int):
-        if not self._updating_ui:
-            self._settings.badge_text_alpha = value
-            self._emit_changes()
-
-    def _pick_badge_bg_color(self):
-        """Open color picker for badge background."""
-        current = QColor(self._settings.badge_bg_r, self._settings.badge_bg_g, self._settings.badge_bg_b)
-        color = QColorDialog.getColor(current, self, "Select Badge Background")
-        if color.isValid():
-            self._settings.badge_bg_r = color.red()
-            self._settings.badge_bg_g = color.green()
-            self._settings.badge_bg_b = color.blue()
-            self._update_color_button(self._badge_bg_btn, color)
-            self._emit_changes()
-
-    def _pick_badge_text_color(self):
-        """Open color picker for badge text."""
-        current = QColor(self._settings.badge_text_r, self._settings.badge_text_g, self._settings.badge_text_b)
-        color = QColorDialog.getColor(current, self, "Select Badge Text Color")
-        if color.isValid():
-            self._settings.badge_text_r = color.red()
-            self._settings.badge_text_g = color.green()
-            self._settings.badge_text_b = color.blue()
-            self._update_color_button(self._badge_text_btn, color)
-            self._emit_changes()
+        self._settings.badge_font_weight = FONT_WEIGHTS.get(name, 400)
+        self._emit_changes()
 
     def _on_interval_changed(self, value: int):
-        if not self._updating_ui:
-            self._settings.update_interval = value
-            self._emit_changes()
+        self._settings.update_interval = value
+        self._emit_changes()
 
     def _on_retry_attempts_changed(self, value: int):
-        if not self._updating_ui:
-            self._settings.retry_attempts = value
-            self._emit_changes()
+        self._settings.retry_attempts = value
+        self._emit_changes()
 
     def _on_retry_wait_changed(self, value: int):
-        if not self._updating_ui:
-            self._settings.retry_wait = value
-            self._emit_changes()
+        self._settings.retry_wait = value
+        self._emit_changes()
 
     def _on_always_on_top_changed(self, state):
-        if not self._updating_ui:
-            self._settings.always_on_top = self._always_on_top.isChecked()
-            self._emit_changes()
+        self._settings.always_on_top = self._always_on_top.isChecked()
+        self._emit_changes()
 
     def _on_launch_on_startup_changed(self, state):
-        if not self._updating_ui:
-            self._settings.launch_on_startup = self._launch_on_startup.isChecked()
-            self._emit_changes()
+        self._settings.launch_on_startup = self._launch_on_startup.isChecked()
+        self._emit_changes()
 
     def _on_indicator_enabled_changed(self, state):
-        if not self._updating_ui:
-            self._settings.indicator_enabled = self._indicator_enabled.isChecked()
-            self._emit_changes()
+        self._settings.indicator_enabled = self._indicator_enabled.isChecked()
+        self._emit_changes()
 
     def _on_indicator_flash_changed(self, state):
-        if not self._updating_ui:
-            self._settings.indicator_flash_enabled = self._indicator_flash_enabled.isChecked()
-            self._emit_changes()
-
-    def _on_indicator_up_alpha_changed(self, value: int):
-        if not self._updating_ui:
-            self._settings.indicator_up_alpha = value
-            self._emit_changes()
-
-    def _on_indicator_down_alpha_changed(self, value: int):
-        if not self._updating_ui:
-            self._settings.indicator_down_alpha = value
-            self._emit_changes()
-
-    def _pick_indicator_up_color(self):
-        """Open color picker for up indicator color."""
-        current = QColor(self._settings.indicator_up_r, self._settings.indicator_up_g, self._settings.indicator_up_b)
-        color = QColorDialog.getColor(current, self, "Select Up Color")
-        if color.isValid():
-            self._settings.indicator_up_r = color.red()
-            self._settings.indicator_up_g = color.green()
-            self._settings.indicator_up_b = color.blue()
-            self._update_color_button(self._indicator_up_btn, color)
-            self._emit_changes()
-
-    def _pick_indicator_down_color(self):
-        """Open color picker for down indicator color."""
-        current = QColor(self._settings.indicator_down_r, self._settings.indicator_down_g, self._settings.indicator_down_b)
-        color = QColorDialog.getColor(current, self, "Select Down Color")
-        if color.isValid():
-            self._settings.indicator_down_r = color.red()
-            self._settings.indicator_down_g = color.green()
-            self._settings.indicator_down_b = color.blue()
-            self._update_color_button(self._indicator_down_btn, color)
-            self._emit_changes()
+        self._settings.indicator_flash_enabled = self._indicator_flash_enabled.isChecked()
+        self._emit_changes()
 
     def _update_notification_controls_state(self):
         """Enable/disable notification controls based on enabled state."""
         enabled = self._notifications_enabled.isChecked()
+        if enabled == self._notification_controls_enabled:
+            return
+        self._notification_controls_enabled = enabled
         self._notification_threshold.setEnabled(enabled)
         self._notification_direction.setEnabled(enabled)
         self._notification_cooldown.setEnabled(enabled)
         self._notification_sound.setEnabled(enabled)
 
     def _on_notifications_enabled_changed(self, state):
-        if not self._updating_ui:
-            self._settings.notifications_enabled = self._notifications_enabled.isChecked()
-            self._update_notification_controls_state()
-            self._emit_changes()
+        self._settings.notifications_enabled = self._notifications_enabled.isChecked()
+        self._update_notification_controls_state()
+        self._emit_changes()
 
     def _on_notification_threshold_changed(self, value: float):
-        if not self._updating_ui:
-            self._settings.notification_threshold = value
-            self._emit_changes()
+        self._settings.notification_threshold = value
+        self._emit_changes()
 
     def _on_notification_direction_changed(self, index: int):
-        if not self._updating_ui:
-            self._settings.notification_direction = self._notification_direction.currentData()
-            self._emit_changes()
+        self._settings.notification_direction = self._notification_direction.currentData()
+        self._emit_changes()
 
     def _on_notification_cooldown_changed(self, value: int):
-        if not self._updating_ui:
-            self._settings.notification_cooldown = value
-            self._emit_changes()
+        self._settings.notification_cooldown = value
+        self._emit_changes()
 
     def _on_notification_sound_changed(self, text: str):
-        if not self._updating_ui:
-            self._settings.notification_sound = text
-            self._emit_changes()
+        self._settings.notification_sound = text
+        self._emit_changes()
 
     def _browse_notification_sound(self):
         """Open file dialog to select notification sound."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Notification Sound",
-            "", "Audio Files (*.mp3 *.wav *.ogg);;All Files (*)"
-        )
-        if file_path:
-            self._notification_sound.setText(file_path)
+        if self._sound_dialog is None:
+            self._sound_dialog = QFileDialog(
+                self, "Select Notification Sound",
+                "", "Audio Files (*.mp3 *.wav *.ogg);;All Files (*)"
+            )
+            self._sound_dialog.setFileMode(QFileDialog.ExistingFile)
+            # Skip per-folder custom icon lookups and symlink resolution while browsing
+            self._sound_dialog.setOption(QFileDialog.DontUseCustomDirectoryIcons, True)
+            self._sound_dialog.setOption(QFileDialog.DontResolveSymlinks, True)
+        if self._sound_dialog.exec():
+            self._notification_sound.setText(self._sound_dialog.selectedFiles()[0])
 
     def _open_font_picker(self):
         """Open the system font picker dialog."""
-        current_font = QFont(self._settings.font_name, self._settings.font_size)
-        font, ok = QFontDialog.getFont(current_font, self)
-        if ok:
-            self._updating_ui = True
-            self._font_combo.setCurrentFont(font)
-            self._font_size.setValue(font.pointSize())
-            self._updating_ui = False
-
-            self._settings.font_name = font.family()
-            self._settings.font_size = font.pointSize()
-            self._emit_changes()
-
-    def _pick_text_color(self):
-        """Open color picker for text color."""
-        current = QColor(self._settings.text_r, self._settings.text_g, self._settings.text_b)
-        color = QColorDialog.getColor(current, self, "Select Text Color")
-        if color.isValid():
-            self._settings.text_r = color.red()
-            self._settings.text_g = color.green()
-            self._settings.text_b = color.blue()
-            self._update_color_button(self._text_color_btn, color)
-            self._emit_changes()
-
-    def _pick_bg_color(self):
-        """Open color picker for background color."""
-        current = QColor(self._settings.bg_r, self._settings.bg_g, self._settings.bg_b)
-        color = QColorDialog.getColor(current, self, "Select Background Color")
-        if color.isValid():
-            self._settings.bg_r = color.red()
-            self._settings.bg_g = color.green()
-            self._settings.bg_b = color.blue()
-            self._update_color_button(self._bg_color_btn, color)
-            self._emit_changes()
+        if self._font_dialog is None:
+            self._font_dialog = QFontDialog(self)
+        self._font_dialog.setCurrentFont(QFont(self._settings.font_name, self._settings.font_size))
+        if self._font_dialog.exec():
+            font = self._font_dialog.selectedFont()
+            with self._batch(self._font_combo, self._font_size):
+                self._font_combo.setCurrentFont(font)
+                self._font_size.setValue(font.pointSize())
+                self._settings.font_name = font.family()
+                self._settings.font_size = font.pointSize()
+
+    def done(self, result: int):
+        """Settle any pending preview update once the dialog closes."""
+        if self._emit_timer.isActive():
+            self._emit_timer.stop()
+            # Accepted: the last debounced edit must still reach the preview
+            if result == QDialog.Accepted:
+                self._flush_changes()
+        super().done(result)
 
     def _on_cancel(self):
         """Cancel and restore original settings."""
-        self.settings_changed.emit(self._original_settings.copy())
+        self._emit_timer.stop()
+        # Nothing to revert unless a preview was sent
+        if self._previewed:
+            self.settings_changed.emit(self._original_settings)
         self.reject()
 
     def _on_save(self):
         """Save settings and close."""
         # Apply launch on startup to registry
         self._settings.set_launch_on_startup(self._settings.launch_on_startup)
-        self._settings.save()
+        # Written on the settings I/O thread; the dialog closes right away
+        self._settings.save_async()
         self.accept()
 
     def get_settings(self) -> Settings:
-        """Get the current settings."""
-        return self._settings.copy()
+        """Get the current settings (the dialog's own object - copy it to keep editing the dialog)."""
+        return self._settings
@@ -1,17 +1,60 @@
 """System tray integration for Crypto Ticker."""
 
+import functools
+import os
 import sys
 from pathlib import Path
-from PySide6.QtWidgets import QSystemTrayIcon, QMenu
-from PySide6.QtGui import QIcon, QImage, QPainter, QFont, QColor, QPixmap
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
+from PySide6.QtGui import QIcon, QImage, QImageReader, QPainter, QFont, QColor, QPixmap
+from PySide6.QtCore import Signal, Qt, QThreadPool
 from PySide6.QtSvg import QSvgRenderer
-from typing import Dict
+from typing import Dict, Optional, Union
 
 from settings import Settings
 from version import __version__, __app_name__
 
 
+@functools.cache
+def _get_app_dir() -> Path:
+    """Get the application directory (fixed for the process)."""
+    if getattr(sys, 'frozen', False):
+        return Path(sys.executable).parent
+    else:
+        return Path(__file__).parent
+
+
+def _find_logo() -> Union[str, QImage, None]:
+    """Locate the logo (ICO/PNG path, or SVG rendered to an image); safe off the UI thread."""
+    # One directory read instead of a stat per candidate file
+    try:
+        with os.scandir(_get_app_dir()) as entries:
+            files = {entry.name.lower(): entry.path for entry in entries if entry.is_file()}
+    except OSError:
+        files = {}
+
+    # ICO or PNG first (native format, better quality), then SVG when Qt's svg
+    # plugin can load it - Qt then renders it at whatever size the tray asks for
+    for name in ("logo.ico", "logo.png", "logo.svg"):
+        if name in files and QImageReader(files[name]).canRead():
+            return files[name]
+
+    # Fallback to rendering the SVG ourselves
+    if "logo.svg" in files:
+        renderer = QSvgRenderer(files["logo.svg"])
+        # Use 64x64 for tray icon (will be scaled by OS)
+        image = QImage(64, 64, QImage.Format_ARGB32)
+        image.fill(0)
+        painter = QPainter(image)
+        renderer.render(painter)
+        painter.end()
+        return image
+    return None
+
+
+# Logo icon, loaded once per process
+_app_icon: Optional[QIcon] = None
+
+
 class TrayIcon(QSystemTrayIcon):
     """System tray icon with price display."""
 
@@ -20,6 +63,8 @@ class TrayIcon(QSystemTrayIcon):
     quit_requested = Signal()
     pause_toggled = Signal(bool)  # True = paused
     notifications_toggled = Signal(bool)  # True = enabled
+    _logo_found = Signal(object)  # _find_logo() result, from the thread pool
+    paused_state_changed = Signal(bool)  # Emit from any thread to call set_paused
 
     def __init__(self, settings: Settings, parent=None):
         super().__init__(parent)
@@ -28,50 +73,66 @@ class TrayIcon(QSystemTrayIcon):
         self._secondary_prices: Dict[str, float] = {}
         self._paused = False
         self._notifications_enabled = settings.notifications_enabled
+        self._price_text = "Loading..."  # Price menu entry text
+        self._last_tooltip = ""
+        self._cache_symbol_texts()
 
         self._setup_icon()
         self._setup_menu()
 
         self.activated.connect(self._on_activated)
-
-    def _get_app_dir(self) -> Path:
-        """Get the application directory."""
-        if getattr(sys, 'frozen', False):
-            return Path(sys.executable).parent
-        else:
-            return Path(__file__).parent
+        # Always queued, so set_paused runs on the GUI thread
+        self.paused_state_changed.connect(self.set_paused, Qt.QueuedConnection)
 
     def _setup_icon(self):
-        """Set up the tray icon from logo file (ICO, PNG, or SVG)."""
-        app_dir = self._get_app_dir()
-
-        # Try ICO or PNG first (native format, better quality)
-        for ext in ['ico', 'png']:
-            icon_path = app_dir / f"logo.{ext}"
-            if icon_path.exists():
-                icon = QIcon(str(icon_path))
-                if not icon.isNull():
-                    self.setIcon(icon)
-                    self._update_tooltip()
-                    return
-
-        # Fallback to SVG rendering
-        svg_path = app_dir / "logo.svg"
-        if svg_path.exists():
-            renderer = QSvgRenderer(str(svg_path))
-            # Use 64x64 for tray icon (will be scaled by OS)
-            image = QImage(64, 64, QImage.Format_ARGB32)
-            image.fill(0)
-            painter = QPainter(image)
-            renderer.render(painter)
-            painter.end()
-            icon = QIcon(QPixmap.fromImage(image))
-            self.setIcon(icon)
+        """Set up the tray icon from the logo file (located and decoded off the UI thread)."""
+        global _app_icon
         self._update_tooltip()
+        self._show_pending = False
+        if _app_icon is None and not QApplication.windowIcon().isNull():
+            # Same logo the app already loaded for its windows - share it, don't decode it again
+            _app_icon = QApplication.windowIcon()
+        if _app_icon is not None:
+            self.setIcon(_app_icon)
+            return
+        self._logo_found.connect(self._on_logo_found)
+        QThreadPool.globalInstance().start(lambda: self._logo_found.emit(_find_logo()))
+
+    def _on_logo_found(self, logo):
+        """Install the logo icon and show the tray if that was waiting for it."""
+        global _app_icon
+        if isinstance(logo, QImage):
+            _app_icon = QIcon(QPixmap.fromImage(logo))
+        else:
+            _app_icon = QIcon(logo) if logo else QIcon()
+        self.setIcon(_app_icon)
+        if self._show_pending and not _app_icon.isNull():
+            self._show_pending = False
+            super().show()
+
+    def show(self):
+        """Show the tray icon (deferred until the logo is loaded)."""
+        if self.icon().isNull():
+            self._show_pending = True
+            return
+        super().show()
+
+    def hide(self):
+        """Hide the tray icon (and cancel a deferred show)."""
+        self._show_pending = False
+        super().hide()
 
     def _setup_menu(self):
         """Set up the context menu."""
-        menu = QMenu()
+        # Built up front: StatusNotifierItem hosts on Linux may read the exported
+        # menu without ever sending aboutToShow
+        self._menu = QMenu()
+        self._build_menu()
+        self.setContextMenu(self._menu)
+
+    def _build_menu(self):
+        """Add the menu actions."""
+        menu = self._menu
 
         # Version at top (disabled)
         version_action = menu.addAction(f"{__app_name__} v{__version__}")
@@ -80,13 +141,13 @@ class TrayIcon(QSystemTrayIcon):
         menu.addSeparator()
 
         # Price display (disabled, just for info)
-        self._price_action = menu.addAction("Loading...")
+        self._price_action = menu.addAction(self._price_text)
         self._price_action.setEnabled(False)
 
         menu.addSeparator()
 
         # Pause/Resume
-        self._pause_action = menu.addAction("Pause")
+        self._pause_action = menu.addAction("Resume" if self._paused else "Pause")
         self._pause_action.triggered.connect(self._on_pause_clicked)
 
         # Notifications toggle
@@ -111,8 +172,6 @@ class TrayIcon(QSystemTrayIcon):
         quit_action = menu.addAction("Quit")
         quit_action.triggered.connect(self.quit_requested.emit)
 
-        self.setContextMenu(menu)
-
     def _on_pause_clicked(self):
         """Handle pause button click."""
         self._paused = not self._paused
@@ -121,8 +180,11 @@ class TrayIcon(QSystemTrayIcon):
 
     def _on_notifications_clicked(self):
         """Handle notifications toggle click."""
-        self._notifications_enabled = self._notifications_action.isChecked()
-        self.notifications_toggled.emit(self._notifications_enabled)
+        enabled = self._notifications_action.isChecked()
+        if enabled == self._notifications_enabled:
+            return
+        self._notifications_enabled = enabled
+        self.notifications_toggled.emit(enabled)
 
     def set_notifications_enabled(self, enabled: bool):
         """Set notifications state (called from outside)."""
@@ -134,44 +196,55 @@ class TrayIcon(QSystemTrayIcon):
         self._paused = paused
         self._pause_action.setText("Resume" if self._paused else "Pause")
 
+    def show_notification(self, title: str, message: str):
+        """Show a notification balloon from the tray icon."""
+        self.showMessage(title, message, QSystemTrayIcon.Information, 5000)
+
     def _on_activated(self, reason):
         """Handle tray icon activation."""
         if reason == QSystemTrayIcon.DoubleClick:
             self.settings_requested.emit()
 
 
-    def _update_tooltip(self):
-        """Update tooltip text."""
-        symbol = self.settings.crypto_symbol.upper()
-        currency = self.settings.vs_currency.upper()
-
-        lines = [f"{__app_name__}"]
+    def _cache_symbol_texts(self):
+        """Upper-case symbol and currency for display (they only change with settings)."""
+        self._symbol_upper = self.settings.crypto_symbol.upper()
+        self._currency_upper = self.settings.vs_currency.upper()
 
+    def _update_tooltip(self):
+        """Update tooltip text (Qt is only told when it changed)."""
+        tooltip = __app_name__
         if self._current_price > 0:
-            lines.append(f"{symbol}: ${self._current_price:,.2f} {currency}")
-
+            # _price_text is formatted by _refresh_display whenever the price is set
+            tooltip += f"\n{self._price_text} {self._currency_upper}"
         if self._paused:
-            lines.append("[PAUSED]")
+            tooltip += "\n[PAUSED]"
 
-        self.setToolTip("\n".join(lines))
+        if tooltip != self._last_tooltip:
+            self._last_tooltip = tooltip
+            self.setToolTip(tooltip)
 
     def set_price(self, price: float):
         """Update the displayed price."""
         self._current_price = price
-
-        # Update tooltip and menu (icon stays as logo)
-        symbol = self.settings.crypto_symbol.upper()
-        price_text = f"{symbol}: ${price:,.2f}"
+        self._refresh_display()
+
+    def _refresh_display(self):
+        """Format the price once for the menu entry and the tooltip (icon stays as logo)."""
+        price_text = f"{self._symbol_upper}: ${self._current_price:,.2f}"
+        if price_text != self._price_text:
+            self._price_text = price_text
+            self._price_action.setText(price_text)
         self._update_tooltip()
-        self._price_action.setText(price_text)
 
     def set_secondary_prices(self, prices: Dict[str, float]):
         """Update secondary cryptocurrency prices."""
+        # Kept for callers; the tooltip only shows the main price, so nothing to redraw
         self._secondary_prices = prices
-        self._update_tooltip()
 
     def apply_settings(self, settings: Settings):
         """Apply new settings."""
         self.settings = settings
+        self._cache_symbol_texts()
         self.set_price(self._current_price)
         self.set_notifications_enabled(settings.notifications_enabled)
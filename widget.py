@@ -1,12 +1,14 @@
 """Transparent desktop widget for Crypto Ticker."""
 
+import bisect
+
 from PySide6.QtWidgets import QWidget, QLabel
-from PySide6.QtCore import Qt, QPoint, Signal, QTimer, QRectF
-from PySide6.QtGui import QFont, QColor, QPainter, QPen, QBrush, QCursor, QFontDatabase
+from PySide6.QtCore import Qt, QPoint, QPointF, QSize, Signal, QTimer, QRect, QRectF
+from PySide6.QtGui import QFont, QColor, QPalette, QPainter, QPen, QPixmap, QBrush, QCursor, QFontDatabase, QFontMetrics
 from typing import Dict
 
 from settings import Settings
-from price_popup import PricePopup
+from price_popup import PricePopup, qt_color, qt_font_weight
 from window_position import WindowPositionManager
 
 
@@ -20,6 +22,28 @@ PADDING_V = 8                  # Vertical padding inside pill
 DOT_SIZE = 2                   # Diameter of each dot
 DOT_SPACING_H = 4              # Horizontal spacing between dot centers
 DOT_SPACING_V = 4              # Vertical spacing between dot centers
+MOVE_BUTTON_PEN_MARGIN = 1     # Half the move button border width, drawn outside its rect
+ANIMATION_INTERVAL_MS = 16     # Hover/flash tick (60 Hz); longer on slower displays
+# Hover fade curve (ease-out, 15% of the remaining distance per 16 ms tick), ending exactly at 1
+_HOVER_EASE = tuple(1 - 0.85 ** i for i in range(19)) + (1.0,)
+
+# Move button dots (2x3 grid) centered in the button, in move button pixmap coordinates
+_DOT_CENTER = MOVE_BUTTON_PEN_MARGIN + MOVE_BUTTON_SIZE / 2
+_DOT_RECTS = tuple(
+    QRectF(
+        _DOT_CENTER - DOT_SPACING_H / 2 + col * DOT_SPACING_H - DOT_SIZE / 2,
+        _DOT_CENTER - DOT_SPACING_V + row * DOT_SPACING_V - DOT_SIZE / 2,
+        DOT_SIZE, DOT_SIZE
+    )
+    for row in range(3) for col in range(2)
+)
+
+
+def _set_text_color(label: QLabel, color: QColor):
+    """Set a label's text color through its palette."""
+    palette = label.palette()
+    palette.setColor(QPalette.WindowText, color)
+    label.setPalette(palette)
 
 
 class PriceWidget(QWidget):
@@ -33,20 +57,34 @@ class PriceWidget(QWidget):
         self._dragging = False
         self._drag_just_ended = False  # Prevents popup rebuild right after drag
         self._drag_start = QPoint()
+        self._move_target = QPoint()  # Latest drag position, applied by _apply_pending_move
+        self._move_pending = False
         self._hovering = False
         self._hover_opacity = 0.0
+        self._hover_target = 0.0  # Direction of the current hover fade
+        self._hover_step = len(_HOVER_EASE) - 1  # Position along _HOVER_EASE (may be fractional)
+        self._tick_scale = 1.0  # Animation tick length relative to ANIMATION_INTERVAL_MS
         self._price_text = "Loading..."
+        self._shown_prefix = None  # Prefix of the price currently in the label
         self._current_price = 0.0
         self._previous_price = 0.0
         self._price_direction = 0  # -1 down, 0 none, 1 up
         self._flash_progress = 0.0  # 0.0 to 1.0 for flash animation
         self._secondary_prices: Dict[str, float] = {}
         self._connection_error = False  # True when API has issues
+        self._popup = None  # Created by _get_popup once secondary prices arrive
+        self._last_layout = None  # (label size, arrow size, has arrow) last laid out
+        self._move_btn_cache = None  # Pre-rendered move button, see _render_move_button
+        self._move_btn_key = None  # (dragging, device pixel ratio) the cache was built for
+        # Reused by paintEvent, only their colors/style change per frame
+        self._bg_brush = QBrush(Qt.SolidPattern)
+        self._border_pen = QPen(QBrush(Qt.SolidPattern), 2)
+        self._rebuild_color_cache()
+        self._update_price_prefix()
 
         self._setup_window()
         self._setup_ui()
         self._setup_animations()
-        self._setup_popup()
         self._setup_position_manager()
 
     def _setup_window(self):
@@ -65,31 +103,28 @@ class PriceWidget(QWidget):
         self._price_label.setAlignment(Qt.AlignCenter)
         # Arrow indicator label (positioned to right of price)
         self._arrow_label = QLabel("", self)
-        
-        # Adjustment attempt for vertical alignment of arrow with text
-        font = QFont(self.settings.font_name, self.settings.font_size)
-        arrow_style = f"background: transparent; padding-bottom: {font.pointSize() / 2}px;"
-        self._arrow_label.setStyleSheet(arrow_style)
-        
+        # Text colors go through the palette (no stylesheet re-parse per flash step)
+        for label in (self._price_label, self._arrow_label):
+            label.setAttribute(Qt.WA_TranslucentBackground)
+            label.setAutoFillBackground(False)
         self._arrow_label.setAlignment(Qt.AlignCenter | Qt.AlignVCenter)
+        self._arrow_label.raise_()  # Keep the arrow above the price label
         self._arrow_label.hide()  # Hidden until direction is known
         self._update_styles()
         self._resize_to_content()
 
     def _setup_animations(self):
-        """Set up hover and flash animations."""
-        self._hover_timer = QTimer(self)
-        self._hover_timer.setInterval(16)
-        self._hover_timer.timeout.connect(self._animate_hover)
-
-        self._flash_timer = QTimer(self)
-        self._flash_timer.setInterval(16)
-        self._flash_timer.timeout.connect(self._animate_flash)
-
-    def _setup_popup(self):
-        """Set up the secondary prices popup."""
-        self._popup = PricePopup(self.settings)
-        self._popup.set_anchor_widget(self)
+        """Set up the shared hover/flash animation timer."""
+        self._anim_timer = QTimer(self)
+        self._anim_timer.setInterval(ANIMATION_INTERVAL_MS)
+        self._anim_timer.timeout.connect(self._tick)
+
+    def _get_popup(self) -> PricePopup:
+        """Get the secondary prices popup, creating it on first use."""
+        if self._popup is None:
+            self._popup = PricePopup(self.settings)
+            self._popup.set_anchor_widget(self)
+        return self._popup
 
     def _setup_position_manager(self):
         """Set up the window position manager."""
@@ -101,108 +136,118 @@ class PriceWidget(QWidget):
         )
         self._position_manager.apply_position()
 
-    def _animate_hover(self):
+    def _start_animation(self):
+        """Start the animation timer if it isn't already running."""
+        if not self._anim_timer.isActive():
+            # Don't tick faster than the widget's screen can show (animation steps
+            # are per tick, so faster displays keep the 60 Hz cadence)
+            screen = self.screen()
+            rate = screen.refreshRate() if screen else 0
+            interval = ANIMATION_INTERVAL_MS
+            if rate > 0:
+                interval = max(interval, int(1000 / rate))
+            self._anim_timer.setInterval(interval)
+            # Animation steps are tuned for 16 ms ticks; scale them so slower
+            # ticks still finish in the same time
+            self._tick_scale = interval / ANIMATION_INTERVAL_MS
+            self._anim_timer.start()
+
+    def _tick(self):
+        """Step whichever animations are in motion; stop the timer when all are idle."""
+        hover_target = 1.0 if self._hovering else 0.0
+        if self._hover_opacity != hover_target:
+            self._animate_hover(hover_target)
+        if self._flash_progress > 0:
+            self._animate_flash()
+        if self._hover_opacity == hover_target and self._flash_progress <= 0:
+            self._anim_timer.stop()
+
+    def _animate_hover(self, target: float):
         """Animate hover effect."""
-        target = 1.0 if self._hovering else 0.0
-        diff = target - self._hover_opacity
-
-        if abs(diff) < 0.05:
-            self._hover_opacity = target
-            self._hover_timer.stop()
+        if target != self._hover_target:
+            # Direction changed: continue along the curve from the current opacity
+            self._hover_target = target
+            progress = self._hover_opacity if target else 1.0 - self._hover_opacity
+            self._hover_step = bisect.bisect_right(_HOVER_EASE, progress)
         else:
-            self._hover_opacity += diff * 0.15
+            self._hover_step += self._tick_scale
+
+        eased = _HOVER_EASE[min(round(self._hover_step), len(_HOVER_EASE) - 1)]
+        self._hover_opacity = eased if target else 1.0 - eased
 
         self.update()
 
     def _animate_flash(self):
         """Animate price flash effect."""
         # Flash fades out over time (1.0 -> 0.0)
-        self._flash_progress -= 0.05
+        self._flash_progress -= 0.05 * self._tick_scale
 
         if self._flash_progress <= 0:
             self._flash_progress = 0.0
-            self._flash_timer.stop()
 
+        # Setting the label palette repaints it
         self._update_price_color()
-        self._price_label.repaint()  # Force immediate visual update
 
     def _start_flash(self):
         """Start the flash animation."""
         if self.settings.indicator_flash_enabled and self._price_direction != 0:
             self._flash_progress = 1.0
-            if not self._flash_timer.isActive():
-                self._flash_timer.start()
+            self._start_animation()
             self._update_price_color()
-            self._price_label.repaint()  # Force immediate visual update
+
+    def _rebuild_color_cache(self):
+        """Build the base colors from settings (called when settings change)."""
+        self._text_color = qt_color(self.settings.text_rgb, self.settings.text_alpha)
+        self._bg_color = qt_color(self.settings.bg_rgb, self.settings.bg_alpha)
+        self._up_color = qt_color(self.settings.indicator_up_rgb, self.settings.indicator_up_alpha)
+        self._down_color = qt_color(self.settings.indicator_down_rgb, self.settings.indicator_down_alpha)
+        # Reused by the border getter, only the alpha changes per paint
+        self._border_color = QColor(self._text_color)
+        self._move_btn_key = None  # Re-render the move button with the new text color
+
+    # The getters below return cached colors; callers must not modify them
 
     def _get_indicator_up_color(self) -> QColor:
         """Get the up indicator color from settings."""
-        return QColor(
-            self.settings.indicator_up_r,
-            self.settings.indicator_up_g,
-            self.settings.indicator_up_b,
-            int(self.settings.indicator_up_alpha * 2.55)
-        )
+        return self._up_color
 
     def _get_indicator_down_color(self) -> QColor:
         """Get the down indicator color from settings."""
-        return QColor(
-            self.settings.indicator_down_r,
-            self.settings.indicator_down_g,
-            self.settings.indicator_down_b,
-            int(self.settings.indicator_down_alpha * 2.55)
-        )
+        return self._down_color
 
     def _get_text_color(self) -> QColor:
         """Get the text color from settings."""
-        return QColor(
-            self.settings.text_r,
-            self.settings.text_g,
-            self.settings.text_b,
-            int(self.settings.text_alpha * 2.55)
-        )
+        return self._text_color
 
     def _get_border_color(self) -> QColor:
         """Get border color (30% of text color)."""
-        color = self._get_text_color()
-        color.setAlpha(int(76 * self._hover_opacity))
-        return color
+        self._border_color.setAlpha(int(76 * self._hover_opacity))
+        return self._border_color
 
     def _get_bg_color(self) -> QColor:
         """Get background color - blends to text color at 10% on hover."""
-        # Base: settings bg color with bg_alpha
-        base_alpha = int(self.settings.bg_alpha * 2.55)
-
-        # On hover: text color at 10% alpha (25.5 out of 255)
-        hover_alpha = int(25 * self._hover_opacity)
-
         if self._hover_opacity > 0.01:
+            # On hover: text color at 10% alpha (25.5 out of 255)
+            hover_alpha = int(25 * self._hover_opacity)
             # Blend towards text color on hover
-            text_color = self._get_text_color()
-            t = self._hover_opacity
-            r = int(self.settings.bg_r * (1 - t))
-            g = int(self.settings.bg_g * (1 - t))
-            b = int(self.settings.bg_b * (1 - t))
-            a = max(base_alpha, hover_alpha)
-            return QColor(r, g, b, a)
+            bg = self._bg_color
+            t = 1 - self._hover_opacity
+            a = max(bg.alpha(), hover_alpha)
+            return QColor(int(bg.red() * t), int(bg.green() * t), int(bg.blue() * t), a)
         else:
-            return QColor(
-                self.settings.bg_r,
-                self.settings.bg_g,
-                self.settings.bg_b,
-                base_alpha
-            )
+            return self._bg_color
 
-    def _get_icon_color(self) -> QColor:
-        """Get move icon color (50% of text color)."""
-        color = self._get_text_color()
-        color.setAlpha(int(127 * self._hover_opacity))
-        return color
+    def _update_price_prefix(self):
+        """Build the text shown before the price number."""
+        if self.settings.show_prefix:
+            self._price_prefix = f"{self.settings.crypto_symbol.upper()}: $"
+        else:
+            self._price_prefix = "$"
 
     def _update_styles(self):
         """Update widget styles from settings."""
         font = QFont(self.settings.font_name, self.settings.font_size)
-        font.setWeight(self._qt_font_weight(self.settings.font_weight))
+        font.setWeight(qt_font_weight(self.settings.font_weight))
         self._price_label.setFont(font)
 
         # Arrow uses OS default sans-serif font at same size
@@ -210,11 +255,12 @@ class PriceWidget(QWidget):
         arrow_font.setPointSize(self.settings.font_size - self.settings.font_size // 4)
         self._arrow_label.setFont(arrow_font)
 
+        # Reused by _resize_to_content until the fonts change again
+        self._fm = QFontMetrics(font)
+        self._fm_arrow = QFontMetrics(arrow_font)
+
         color = self._get_text_color()
-        self._price_label.setStyleSheet(
-            f"color: rgba({color.red()}, {color.green()}, {color.blue()}, {color.alpha()}); "
-            f"background: transparent;"
-        )
+        _set_text_color(self._price_label, color)
         self._update_arrow_style()
 
     def _update_arrow_style(self):
@@ -223,11 +269,7 @@ class PriceWidget(QWidget):
         if self._connection_error:
             self._arrow_label.setText("!")  # Warning indicator
             color = QColor(255, 165, 0, 255)  # Orange for warning
-            self._arrow_label.setStyleSheet(
-                f"color: rgba({color.red()}, {color.green()}, {color.blue()}, {color.alpha()}); "
-                f"background: transparent;"
-            )
-            self._arrow_label.raise_()
+            _set_text_color(self._arrow_label, color)
             return
 
         if not self.settings.indicator_enabled or self._price_direction == 0:
@@ -243,11 +285,7 @@ class PriceWidget(QWidget):
             color = self._get_indicator_down_color()
 
         self._arrow_label.setText(arrow_char)
-        self._arrow_label.setStyleSheet(
-            f"color: rgba({color.red()}, {color.green()}, {color.blue()}, {color.alpha()}); "
-            f"background: transparent;"
-        )
-        self._arrow_label.raise_()  # Ensure arrow is on top
+        _set_text_color(self._arrow_label, color)
 
     def _update_price_color(self):
         """Update price label color, blending with indicator color during flash."""
@@ -269,39 +307,21 @@ class PriceWidget(QWidget):
         else:
             color = base_color
 
-        self._price_label.setStyleSheet(
-            f"color: rgba({color.red()}, {color.green()}, {color.blue()}, {color.alpha()}); "
-            f"background: transparent;"
-        )
-
-    def _qt_font_weight(self, weight: int) -> QFont.Weight:
-        """Convert numeric weight to Qt weight."""
-        if weight <= 100:
-            return QFont.Thin
-        elif weight <= 200:
-            return QFont.ExtraLight
-        elif weight <= 300:
-            return QFont.Light
-        elif weight <= 400:
-            return QFont.Normal
-        elif weight <= 500:
-            return QFont.Medium
-        elif weight <= 600:
-            return QFont.DemiBold
-        elif weight <= 700:
-            return QFont.Bold
-        elif weight <= 800:
-            return QFont.ExtraBold
-        else:
-            return QFont.Black
+        _set_text_color(self._price_label, color)
 
     def _resize_to_content(self):
         """Resize widget to fit content."""
-        label_size = self._price_label.sizeHint()
-        arrow_size = self._arrow_label.sizeHint()
+        label_size = QSize(self._fm.horizontalAdvance(self._price_text), self._fm.height())
+        arrow_text = self._arrow_label.text()
+        arrow_size = QSize(self._fm_arrow.horizontalAdvance(arrow_text), self._fm_arrow.height())
 
         # Arrow width (only if has text and indicator enabled)
-        has_arrow = bool(self._arrow_label.text()) and self.settings.indicator_enabled
+        has_arrow = bool(arrow_text) and self.settings.indicator_enabled
+        layout = (label_size, arrow_size, has_arrow)
+        if layout == self._last_layout:
+            return
+        self._last_layout = layout
+
         # Match popup's grid spacing (8px base, scaled with font)
         arrow_gap = arrow_size.width() * 0.9 if has_arrow else 0
         arrow_width = (arrow_size.width() + arrow_gap) if has_arrow else 0
@@ -342,26 +362,34 @@ class PriceWidget(QWidget):
 
     def set_price(self, price: float):
         """Update the displayed price."""
+        # Same quote already shown with the current prefix: nothing to do
+        if price == self._current_price and self._shown_prefix == self._price_prefix:
+            return
+
         # Track direction for indicator (compare with current, not previous)
         should_flash = False
+        arrow_changed = False
         if self._current_price > 0 and price != self._current_price:
             new_direction = 1 if price > self._current_price else -1
             if new_direction != self._price_direction:
                 self._price_direction = new_direction
                 self._update_arrow_style()
+                arrow_changed = True
             should_flash = True
 
         self._previous_price = self._current_price
         self._current_price = price
 
-        if self.settings.show_prefix:
-            prefix = self.settings.crypto_symbol.upper()
-            self._price_text = f"{prefix}: ${price:,.2f}"
-        else:
-            self._price_text = f"${price:,.2f}"
+        price_text = self._price_prefix + format(price, ",.2f")
 
-        self._price_label.setText(self._price_text)
-        self._resize_to_content()
+        # Same text and arrow: skip the relayout and resize
+        if price_text != self._price_text:
+            self._price_text = price_text
+            self._shown_prefix = self._price_prefix
+            self._price_label.setText(price_text)
+            self._resize_to_content()
+        elif arrow_changed:
+            self._resize_to_content()
 
         # Trigger flash AFTER text is set to ensure color applies correctly
         if should_flash:
@@ -369,34 +397,41 @@ class PriceWidget(QWidget):
 
     def set_secondary_prices(self, prices: Dict[str, float]):
         """Update secondary cryptocurrency prices."""
+        if prices == self._secondary_prices:
+            return
         self._secondary_prices = prices
-        self._popup.set_prices(prices)
+        self._get_popup().set_prices(prices)
         self._update_popup_visibility()
 
     def _update_popup_visibility(self):
         """Update popup visibility based on settings and state."""
-        if not self._secondary_prices:
-            self._popup.hide()
-            return
+        if self._popup is None:
+            return  # No secondary prices have arrived yet
 
-        if self.settings.secondary_display == "always":
+        display = self.settings.secondary_display
+        visible = bool(self._secondary_prices) and (
+            display == "always" or (display == "hover" and self._hovering)
+        )
+        # Only act on transitions: showing rebuilds the popup's labels, and a
+        # visible popup already rebuilds itself when its prices or settings change
+        if visible == self._popup.isVisible():
+            return
+        if visible:
             self._popup.show_below_anchor()
-        elif self.settings.secondary_display == "hover":
-            if self._hovering:
-                self._popup.show_below_anchor()
-            else:
-                self._popup.hide()
+        else:
+            self._popup.hide()
 
     def apply_settings(self, settings: Settings):
         """Apply new settings."""
         self.settings = settings
+        self._rebuild_color_cache()
+        self._update_price_prefix()
         self._update_styles()
 
-        # Reformat price text with new settings
+        # Reformat price text with new settings (font may change size even if text doesn't)
         if self._current_price > 0:
             self.set_price(self._current_price)
-        else:
-            self._resize_to_content()
+        self._resize_to_content()
 
         # Update always on top without recreating window
         current_flags = self.windowFlags()
@@ -410,25 +445,64 @@ class PriceWidget(QWidget):
             self.show()
 
         # Update popup settings
-        self._popup.apply_settings(settings)
-        self._update_popup_visibility()
+        if self._popup is not None:
+            self._popup.apply_settings(settings)
+            self._update_popup_visibility()
 
         # Repaint to apply visual changes (background, colors)
         self.update()
 
+    def _render_move_button(self, dpr: float) -> QPixmap:
+        """Rasterize the move button (background, border, dots) at full hover opacity."""
+        size = MOVE_BUTTON_SIZE + MOVE_BUTTON_PEN_MARGIN * 2
+        pixmap = QPixmap(int(size * dpr), int(size * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Leave room for the half of the border pen outside the button rect
+        m = MOVE_BUTTON_PEN_MARGIN
+        move_btn_rect = QRectF(m, m, MOVE_BUTTON_SIZE, MOVE_BUTTON_SIZE)
+
+        # Move button background - solid black to avoid transparency overlap
+        painter.setBrush(QBrush(QColor(0, 0, 0)))
+        painter.setPen(Qt.NoPen)
+        painter.drawRoundedRect(move_btn_rect, MOVE_BUTTON_CORNER_RADIUS, MOVE_BUTTON_CORNER_RADIUS)
+
+        # Move button border (30% of text color)
+        border_color = QColor(self._text_color)
+        border_color.setAlpha(76)
+        pen = QPen(border_color, 2)
+        if self._dragging:
+            pen.setStyle(Qt.DashLine)
+        painter.setPen(pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRoundedRect(move_btn_rect, MOVE_BUTTON_CORNER_RADIUS, MOVE_BUTTON_CORNER_RADIUS)
+
+        # Draw 6 dots (2x3 grid) centered in move button (50% of text color)
+        icon_color = QColor(self._text_color)
+        icon_color.setAlpha(127)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(icon_color))
+        for dot_rect in _DOT_RECTS:
+            painter.drawEllipse(dot_rect)
+
+        painter.end()
+        return pixmap
+
     def paintEvent(self, event):
         """Custom paint for pill shape and move button."""
+        region = event.region()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
+        # Only the invalidated area is redrawn (e.g. just the label during a flash)
+        painter.setClipRegion(region)
 
         h = self.height()
         w = self.width()
 
         # Calculate positions
-        move_btn_center_x = MOVE_BUTTON_SIZE / 2
-        move_btn_center_y = h / 2
-        move_btn_radius = MOVE_BUTTON_SIZE / 2
-
         pill_x = MOVE_BUTTON_SIZE - MOVE_BUTTON_OVERLAP
         pill_width = w - pill_x
         pill_height = h
@@ -438,71 +512,38 @@ class PriceWidget(QWidget):
         pill_rect = QRectF(pill_x + 1, 1, pill_width - 2, pill_height - 2)
         bg_color = self._get_bg_color()
         if bg_color.alpha() > 0:
-            painter.setBrush(QBrush(bg_color))
+            self._bg_brush.setColor(bg_color)
+            painter.setBrush(self._bg_brush)
             painter.setPen(Qt.NoPen)
             painter.drawRoundedRect(pill_rect, pill_radius, pill_radius)
 
         # Draw pill border on hover
         if self._hover_opacity > 0.05:
-            border_color = self._get_border_color()
-            pen = QPen(border_color, 2)
-            if self._dragging:
-                pen.setStyle(Qt.DashLine)
-            painter.setPen(pen)
+            self._border_pen.setColor(self._get_border_color())
+            self._border_pen.setStyle(Qt.DashLine if self._dragging else Qt.SolidLine)
+            painter.setPen(self._border_pen)
             painter.setBrush(Qt.NoBrush)
             painter.drawRoundedRect(pill_rect, pill_radius, pill_radius)
 
-        # Draw move button on hover
-        if self._hover_opacity > 0.05:
-            # Move button background - solid black to avoid transparency overlap
-            move_bg_color = QColor(0, 0, 0, int(255 * self._hover_opacity))
-
-            move_btn_rect = QRectF(
-                move_btn_center_x - move_btn_radius,
-                move_btn_center_y - move_btn_radius,
-                MOVE_BUTTON_SIZE,
-                MOVE_BUTTON_SIZE
+        # Draw move button on hover (skipped when outside the repainted region)
+        if self._hover_opacity > 0.05 and region.intersects(QRect(0, 0, MOVE_BUTTON_SIZE, h)):
+            dpr = self.devicePixelRatioF()
+            if self._move_btn_key != (self._dragging, dpr):
+                self._move_btn_cache = self._render_move_button(dpr)
+                self._move_btn_key = (self._dragging, dpr)
+            # Cached at full opacity, faded in with the hover
+            painter.setOpacity(self._hover_opacity)
+            painter.drawPixmap(
+                QPointF(-MOVE_BUTTON_PEN_MARGIN, h / 2 - MOVE_BUTTON_SIZE / 2 - MOVE_BUTTON_PEN_MARGIN),
+                self._move_btn_cache
             )
 
-            painter.setBrush(QBrush(move_bg_color))
-            painter.setPen(Qt.NoPen)
-            painter.drawRoundedRect(move_btn_rect, MOVE_BUTTON_CORNER_RADIUS, MOVE_BUTTON_CORNER_RADIUS)
-
-            # Move button border
-            border_color = self._get_border_color()
-            pen = QPen(border_color, 2)
-            if self._dragging:
-                pen.setStyle(Qt.DashLine)
-            painter.setPen(pen)
-            painter.setBrush(Qt.NoBrush)
-            painter.drawRoundedRect(move_btn_rect, MOVE_BUTTON_CORNER_RADIUS, MOVE_BUTTON_CORNER_RADIUS)
-
-            # Draw 6 dots (2x3 grid) centered in move button
-            icon_color = self._get_icon_color()
-            if icon_color.alpha() > 0:
-                painter.setPen(Qt.NoPen)
-                painter.setBrush(QBrush(icon_color))
-
-                grid_width = DOT_SPACING_H
-                grid_height = DOT_SPACING_V * 2
-
-                start_x = move_btn_center_x - grid_width / 2
-                start_y = move_btn_center_y - grid_height / 2
-
-                for row in range(3):
-                    for col in range(2):
-                        cx = start_x + col * DOT_SPACING_H
-                        cy = start_y + row * DOT_SPACING_V
-                        painter.drawEllipse(
-                            QRectF(cx - DOT_SIZE/2, cy - DOT_SIZE/2, DOT_SIZE, DOT_SIZE)
-                        )
-
         painter.end()
 
     def enterEvent(self, event):
         """Mouse entered widget."""
         self._hovering = True
-        self._hover_timer.start()
+        self._start_animation()
         self._update_popup_visibility()
         super().enterEvent(event)
 
@@ -510,7 +551,7 @@ class PriceWidget(QWidget):
         """Mouse left widget."""
         if not self._dragging and not self._drag_just_ended:
             self._hovering = False
-            self._hover_timer.start()
+            self._start_animation()
             self._update_popup_visibility()
         super().leaveEvent(event)
 
@@ -531,6 +572,7 @@ class PriceWidget(QWidget):
             self._dragging = False
             self._drag_just_ended = True  # Prevent popup rebuild in leaveEvent
             self.setCursor(QCursor(Qt.ArrowCursor))
+            self._apply_pending_move()  # Land on the final drag position before saving
 
             # Save position (corner-relative)
             self._position_manager.set_position(self.x(), self.y())
@@ -541,14 +583,16 @@ class PriceWidget(QWidget):
             self.settings.save()
 
             # Ensure popup position is finalized after drag
-            self._popup.update_position()
+            if self._popup is not None:
+                self._popup.update_position()
 
             # Clear drag_just_ended flag after a short delay
             QTimer.singleShot(100, self._clear_drag_ended_flag)
 
             if not self.underMouse():
                 self._hovering = False
-            self._hover_timer.start()
+            self._start_animation()
+            self.update()  # Back to solid borders even if the hover has settled
         super().mouseReleaseEvent(event)
 
     def _clear_drag_ended_flag(self):
@@ -558,11 +602,22 @@ class PriceWidget(QWidget):
     def mouseMoveEvent(self, event):
         """Handle mouse move for dragging."""
         if self._dragging:
-            new_pos = event.globalPosition().toPoint() - self._drag_start
-            self.move(new_pos)
-            self._popup.update_position()
+            # Coalesce high-rate mouse reports into one move per event loop pass
+            self._move_target = event.globalPosition().toPoint() - self._drag_start
+            if not self._move_pending:
+                self._move_pending = True
+                QTimer.singleShot(0, self._apply_pending_move)
         super().mouseMoveEvent(event)
 
+    def _apply_pending_move(self):
+        """Move the widget (and popup) to the latest drag position."""
+        if not self._move_pending:
+            return
+        self._move_pending = False
+        self.move(self._move_target)
+        if self._popup is not None:
+            self._popup.update_position()
+
     def contextMenuEvent(self, event):
         """Right-click opens settings."""
         self.settings_requested.emit()
@@ -1,9 +1,10 @@
 """Window positioning module with corner-relative positioning and resolution change handling."""
 
 from PySide6.QtWidgets import QWidget, QApplication
-from PySide6.QtCore import QObject, Signal, QRect
+from PySide6.QtCore import QObject, QMetaObject, QTimer, Signal, QRect
+from PySide6.QtGui import QScreen
 from enum import Enum
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 
 
 class Corner(Enum):
@@ -14,6 +15,16 @@ class Corner(Enum):
     BOTTOM_RIGHT = "bottom_right"
 
 
+# Corner -> (fx, fy, sx, sy): fx/fy pick the left/top (0) or right/bottom (1) edge,
+# sx/sy give the direction the offset moves away from that edge
+_CORNER_ANCHORS = {
+    Corner.TOP_LEFT: (0, 0, 1, 1),
+    Corner.TOP_RIGHT: (1, 0, -1, 1),
+    Corner.BOTTOM_LEFT: (0, 1, 1, -1),
+    Corner.BOTTOM_RIGHT: (1, 1, -1, -1),
+}
+
+
 class WindowPositionManager(QObject):
     """Manages window position relative to screen corners."""
 
@@ -26,60 +37,85 @@ class WindowPositionManager(QObject):
         self._offset_x = 100
         self._offset_y = 100
         self._last_screen_geometry: Optional[QRect] = None
+        self._screen_connections: Dict[QScreen, Tuple[QMetaObject.Connection, ...]] = {}
+        self._cached_geo: Optional[QRect] = None  # Primary screen area, reset by screen signals
+
+        # Screen events tend to arrive in bursts; validate once per burst
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(0)
+        self._validate_timer.timeout.connect(self._validate_position)
 
         # Connect to screen changes
         app = QApplication.instance()
         if app:
             for screen in app.screens():
-                screen.geometryChanged.connect(self._on_screen_changed)
+                self._watch_screen(screen)
             app.screenAdded.connect(self._on_screen_added)
             app.screenRemoved.connect(self._on_screen_removed)
+            app.primaryScreenChanged.connect(self._on_screen_changed)
+
+    def _watch_screen(self, screen: QScreen):
+        """Follow a screen's geometry and work area changes."""
+        self._screen_connections[screen] = (
+            screen.geometryChanged.connect(self._on_screen_changed),
+            screen.availableGeometryChanged.connect(self._on_screen_changed),
+        )
 
     def _on_screen_added(self, screen):
         """Handle new screen added."""
-        screen.geometryChanged.connect(self._on_screen_changed)
-        self._validate_position()
+        self._watch_screen(screen)
+        self._cached_geo = None
+        self._validate_timer.start()
 
     def _on_screen_removed(self, screen):
         """Handle screen removed."""
-        self._validate_position()
-
-    def _on_screen_changed(self, geometry):
-        """Handle screen geometry change."""
-        self._validate_position()
+        for connection in self._screen_connections.pop(screen, ()):
+            try:
+                QObject.disconnect(connection)
+            except RuntimeError:
+                pass  # Screen already destroyed
+        self._cached_geo = None
+        self._validate_timer.start()
+
+    def _on_screen_changed(self, *args):
+        """Handle screen geometry, work area or primary screen change."""
+        self._cached_geo = None
+        self._validate_timer.start()
 
     def _get_screen_geometry(self) -> QRect:
-        """Get current screen geometry."""
-        screen = QApplication.primaryScreen()
-        if screen:
-            return screen.availableGeometry()
-        return QRect(0, 0, 1920, 1080)  # Fallback
+        """Get current screen geometry (cached until a screen signal resets it)."""
+        if self._cached_geo is None:
+            screen = QApplication.primaryScreen()
+            if not screen:
+                return QRect(0, 0, 1920, 1080)  # Fallback
+            self._cached_geo = screen.availableGeometry()
+        return self._cached_geo
 
     def _find_closest_corner(self, x: int, y: int) -> Tuple[Corner, int, int]:
         """Find the closest corner and calculate offset from it."""
         geo = self._get_screen_geometry()
 
-        # Calculate distances to each corner
-        corners = {
-            Corner.TOP_LEFT: (x - geo.left(), y - geo.top()),
-            Corner.TOP_RIGHT: (geo.right() - x - self._widget.width(), y - geo.top()),
-            Corner.BOTTOM_LEFT: (x - geo.left(), geo.bottom() - y - self._widget.height()),
-            Corner.BOTTOM_RIGHT: (geo.right() - x - self._widget.width(),
-                                  geo.bottom() - y - self._widget.height()),
-        }
-
-        # Find corner with smallest combined offset (closest)
-        closest = Corner.TOP_LEFT
-        min_dist = float('inf')
-
-        for corner, (ox, oy) in corners.items():
-            dist = abs(ox) + abs(oy)
-            if dist < min_dist:
-                min_dist = dist
-                closest = corner
-
-        offset_x, offset_y = corners[closest]
-        return closest, offset_x, offset_y
+        # Offsets from each screen edge
+        left = x - geo.left()
+        top = y - geo.top()
+        right = geo.right() - x - self._widget.width()
+        bottom = geo.bottom() - y - self._widget.height()
+
+        # Closest corner: smallest combined offset (ties keep the earlier corner)
+        d_left, d_top, d_right, d_bottom = abs(left), abs(top), abs(right), abs(bottom)
+        closest = (Corner.TOP_LEFT, left, top)
+        min_dist = d_left + d_top
+        if d_right + d_top < min_dist:
+            closest = (Corner.TOP_RIGHT, right, top)
+            min_dist = d_right + d_top
+        if d_left + d_bottom < min_dist:
+            closest = (Corner.BOTTOM_LEFT, left, bottom)
+            min_dist = d_left + d_bottom
+        if d_right + d_bottom < min_dist:
+            closest = (Corner.BOTTOM_RIGHT, right, bottom)
+
+        return closest
 
     def _calculate_absolute_position(self) -> Tuple[int, int]:
         """Calculate absolute position from corner and offset."""
@@ -87,18 +123,10 @@ class WindowPositionManager(QObject):
         w = self._widget.width()
         h = self._widget.height()
 
-        if self._corner == Corner.TOP_LEFT:
-            x = geo.left() + self._offset_x
-            y = geo.top() + self._offset_y
-        elif self._corner == Corner.TOP_RIGHT:
-            x = geo.right() - w - self._offset_x
-            y = geo.top() + self._offset_y
-        elif self._corner == Corner.BOTTOM_LEFT:
-            x = geo.left() + self._offset_x
-            y = geo.bottom() - h - self._offset_y
-        else:  # BOTTOM_RIGHT
-            x = geo.right() - w - self._offset_x
-            y = geo.bottom() - h - self._offset_y
+        fx, fy, sx, sy = _CORNER_ANCHORS[self._corner]
+        left, top = geo.left(), geo.top()
+        x = left + fx * (geo.right() - w - left) + sx * self._offset_x
+        y = top + fy * (geo.bottom() - h - top) + sy * self._offset_y
 
         return x, y
 